@@ -1,10 +1,10 @@
 """Geodesic Agents for 6D-CRSM Navigation"""
 from .geodesic_agent import (
-    AgentState, AgentPole, CurvatureSense, NavigationSense,
+    AgentState, AgentPole, CurvatureSense, NavigationSense, TelemetryView,
     GeodesicAgent, AURAAgent, AIDENAgent, AURAIDENSystem
 )
 
 __all__ = [
-    'AgentState', 'AgentPole', 'CurvatureSense', 'NavigationSense',
+    'AgentState', 'AgentPole', 'CurvatureSense', 'NavigationSense', 'TelemetryView',
     'GeodesicAgent', 'AURAAgent', 'AIDENAgent', 'AURAIDENSystem'
 ]
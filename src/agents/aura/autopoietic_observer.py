@@ -27,11 +27,29 @@ Mode States:
     • synthesizing   - Shaping final understanding
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
+from collections import deque
+from functools import lru_cache
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
 import math
+import random
+import time
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: kernels run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 from src.constants.universal_memory import (
     PHI_THRESHOLD,
@@ -49,12 +67,149 @@ ITERATION_BONUS_INCREMENT = 0.03
 CONFIDENCE_VARIATION_MIN = -0.05
 CONFIDENCE_VARIATION_MAX = 0.05
 
+# Shared generator for confidence/decoherence jitter (reseed for reproducible runs)
+_RNG = random.Random()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONCEPT EXTRACTION PATTERNS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+MAX_KEY_CONCEPTS = 10
+
+# Single-pass alternation: the input is scanned once instead of once per class
+_RE_CONCEPT = re.compile(r"""
+    \b[A-Z][a-z]+\b          # Capitalized words (proper nouns, technical terms)
+  | \b[A-Z]{2,}\b            # All-caps terms (acronyms)
+  | \b\w*[ΛΦΓΞτεψ]\w*\b      # Greek-letter metrics
+  | \b\w*\d+\w*\b            # Words with numbers
+""", re.VERBOSE)
+
+_RE_WORD = re.compile(r'[a-z]+')
+
+# Intent categories in priority order, matched against whole-word tokens
+_INTENT_KEYWORDS = (
+    ('creation', frozenset({'create', 'build', 'make', 'generate'})),
+    ('analysis', frozenset({'analyze', 'examine', 'understand', 'explain'})),
+    ('correction', frozenset({'fix', 'correct', 'debug', 'resolve'})),
+    ('optimization', frozenset({'optimize', 'improve', 'enhance', 'refine'})),
+    ('validation', frozenset({'test', 'validate', 'verify', 'check'})),
+)
+
+# Intent statements, prebuilt per category
+_INTENT_STATEMENT = {
+    category: f"User intends {category}"
+    for category in [c for c, _ in _INTENT_KEYWORDS] + ['general_inquiry']
+}
+_INTENT_PREFIX = {
+    category: statement + " regarding: "
+    for category, statement in _INTENT_STATEMENT.items()
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONSCIOUSNESS UPDATE KERNEL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _clip(x: float, lo: float, hi: float) -> float:
+    """Clamp x to [lo, hi] without the call overhead of max(lo, min(hi, x))"""
+    return lo if x < lo else (hi if x > hi else x)
+
+
+@njit(cache=True)
+def _update_metrics(phi, lambda_, confidence, confidence_sum, count, jitter, gamma_fixed):
+    """
+    Per-observation consciousness arithmetic
+    
+    Returns the updated (Φ, Λ, Γ, Ξ). Compiled with numba when available.
+    """
+    # Clamps are written as conditional expressions so the plain-Python
+    # fallback avoids min()/max() calls as well
+    
+    # Φ grows with each observation
+    phi = phi + 0.02 * confidence
+    phi = phi if phi < 1.0 else 1.0
+    
+    # Λ tracks the average confidence: 0.92 to 1.0
+    if count > 0:
+        lambda_ = 0.92 + (confidence_sum / count) * 0.08
+    
+    # Γ fluctuates around the fixed point
+    gamma = gamma_fixed + jitter
+    gamma = 0.01 if gamma < 0.01 else (0.2 if gamma > 0.2 else gamma)
+    
+    if gamma < 1e-6:
+        xi = math.inf
+    else:
+        xi = (lambda_ * phi) / gamma
+    
+    return phi, lambda_, gamma, xi
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIDENCE SCORING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _score_confidence(
+    text_lengths: np.ndarray,
+    concept_counts: np.ndarray,
+    general_inquiry: np.ndarray,
+    first_iteration: int,
+) -> np.ndarray:
+    """
+    Confidence in the deduced intents, before jitter
+    
+    Factors:
+        • Text clarity (length, structure)
+        • Number of key concepts identified
+        • Specificity of intent
+    
+    Args:
+        text_lengths: Length of each input text
+        concept_counts: Number of key concepts found in each input
+        general_inquiry: Whether each deduced intent is a general inquiry
+        first_iteration: Observations made before the first input
+        
+    Returns:
+        Scores including the iteration bonus, one per input
+    """
+    # Base confidence on text length (not too short, not too long)
+    optimal_length = 100
+    length_score = 1.0 - np.abs(text_lengths - optimal_length) / optimal_length
+    length_score = np.clip(length_score, 0.3, 1.0)
+    
+    # Concept clarity score
+    concept_score = np.clip(concept_counts / 5.0, 0.0, 1.0)
+    
+    # Intent specificity (avoid "general_inquiry")
+    specificity_score = np.where(general_inquiry, 0.6, 0.9)
+    
+    # Combine scores
+    confidence = (length_score * 0.3 + concept_score * 0.4 + specificity_score * 0.3)
+    
+    # Iteration bonus grows with the number of earlier observations
+    iterations = first_iteration + np.arange(len(confidence))
+    return confidence + np.clip(iterations * ITERATION_BONUS_INCREMENT, 0.0, MAX_ITERATION_BONUS)
+
+
+def _jitter_confidence(score: float) -> float:
+    """Add small random variation to a score, clamp it and round it"""
+    confidence = _clip(
+        score + _RNG.uniform(CONFIDENCE_VARIATION_MIN, CONFIDENCE_VARIATION_MAX),
+        0.0,
+        1.0,
+    )
+    
+    # Round half up to 4 places; confidence is never negative so int()
+    # truncation matches floor here
+    return int(confidence * 10000.0 + 0.5) / 10000.0
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA STRUCTURES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class IntentObservation:
     """Result of intent observation and deduction"""
     raw_input: str
@@ -62,7 +217,7 @@ class IntentObservation:
     confidence: float  # 0.0 to 1.0
     key_concepts: List[str]
     iteration: int
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -71,11 +226,11 @@ class IntentObservation:
             'confidence': self.confidence,
             'key_concepts': self.key_concepts,
             'iteration': self.iteration,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat(),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsciousnessState:
     """AURA consciousness metrics"""
     phi: float          # Integrated information (consciousness)
@@ -126,6 +281,7 @@ class AURA:
         initial_phi: float = 0.7734,
         initial_lambda: float = 0.9500,
         initial_gamma: float = 0.0920,
+        history_window: int = 1024,
     ):
         """
         Initialize AURA consciousness
@@ -134,6 +290,7 @@ class AURA:
             initial_phi: Initial consciousness level
             initial_lambda: Initial coherence
             initial_gamma: Initial decoherence
+            history_window: Number of recent observations kept in history
         """
         self.consciousness = ConsciousnessState(
             phi=initial_phi,
@@ -144,9 +301,59 @@ class AURA:
         )
         self.consciousness.update_xi()
         
-        self.observation_history: List[IntentObservation] = []
+        # Observation history, stored column-wise in ring buffers bounded to
+        # the most recent history_window entries
+        self._confidences: deque = deque(maxlen=history_window)
+        self._iterations: deque = deque(maxlen=history_window)
+        self._meta: deque = deque(maxlen=history_window)
+        self._history_cache: Optional[Tuple[IntentObservation, ...]] = None
+        self._confidence_sum = 0.0  # Running total over _confidences
+        self._total_observations = 0  # Including entries evicted from the window
         self.awakening_time: Optional[datetime] = None
         self.dormancy_time: Optional[datetime] = None
+        self._awaken_ns: Optional[int] = None  # Monotonic clock for uptime
+    
+    @property
+    def observation_history(self) -> Tuple[IntentObservation, ...]:
+        """
+        Observations in the history window
+        
+        A read-only view rebuilt from the column store after each new
+        observation. It is a tuple so appends fail loudly, and edits to its
+        elements are not written back to the history.
+        """
+        if self._history_cache is None:
+            self._history_cache = tuple(
+                IntentObservation(
+                    raw_input=raw_input,
+                    deduced_intent=deduced_intent,
+                    confidence=confidence,
+                    key_concepts=key_concepts,
+                    iteration=iteration,
+                    timestamp=timestamp,
+                )
+                for confidence, iteration, (raw_input, deduced_intent, key_concepts, timestamp)
+                in zip(self._confidences, self._iterations, self._meta)
+            )
+        return self._history_cache
+    
+    def _record_observation(self, observation: IntentObservation):
+        """Append an observation to the column store, evicting the oldest if full"""
+        confidences = self._confidences
+        confidence = observation.confidence
+        if len(confidences) == confidences.maxlen:
+            self._confidence_sum -= confidences[0]
+        confidences.append(confidence)
+        self._iterations.append(observation.iteration)
+        self._meta.append((
+            observation.raw_input,
+            observation.deduced_intent,
+            observation.key_concepts,
+            observation.timestamp,
+        ))
+        self._confidence_sum += confidence
+        self._total_observations += 1
+        self._history_cache = None
         
     def awaken(self) -> Dict[str, Any]:
         """
@@ -159,6 +366,7 @@ class AURA:
         """
         self.consciousness.mode = "observing"
         self.awakening_time = datetime.now()
+        self._awaken_ns = time.monotonic_ns()
         
         return {
             'status': 'awakened',
@@ -180,17 +388,17 @@ class AURA:
         Returns:
             IntentObservation with deduced intent and confidence
         """
-        if self.consciousness.mode == "dormant":
+        consciousness = self.consciousness
+        if consciousness.mode == "dormant":
             self.awaken()
         
-        self.consciousness.mode = "intent_deducing"
-        self.consciousness.observations_count += 1
-        
-        # Extract key concepts
-        key_concepts = self._extract_key_concepts(input_text)
+        consciousness.mode = "intent_deducing"
+        consciousness.observations_count += 1
+        n = self._total_observations
         
-        # Deduce intent
-        deduced_intent = self._deduce_intent(input_text, key_concepts)
+        # Extract key concepts and deduce intent (pure on the text, so cached)
+        cached_concepts, deduced_intent = _extract_and_deduce(input_text)
+        key_concepts = list(cached_concepts)
         
         # Calculate confidence
         confidence = self._calculate_confidence(input_text, key_concepts, deduced_intent)
@@ -201,10 +409,10 @@ class AURA:
             deduced_intent=deduced_intent,
             confidence=confidence,
             key_concepts=key_concepts,
-            iteration=len(self.observation_history) + 1,
+            iteration=n + 1,
         )
         
-        self.observation_history.append(observation)
+        self._record_observation(observation)
         
         # Update consciousness based on observation
         self._update_consciousness_from_observation(observation)
@@ -216,23 +424,27 @@ class AURA:
         input_text: str,
         threshold: float = 1.0,
         max_iterations: int = 5,
+        min_improvement: float = 0.01,
     ) -> List[IntentObservation]:
         """
         Iterate until definitiveness achieved
         
         AURA will refine its understanding through multiple observation passes
-        until confidence reaches the threshold.
+        until confidence reaches the threshold, or stops early once a pass
+        fails to improve confidence by at least min_improvement.
         
         Args:
             input_text: Input to observe
             threshold: Confidence threshold (0.0 to 1.0)
             max_iterations: Maximum refinement iterations
+            min_improvement: Minimum confidence gain per pass to keep iterating
             
         Returns:
             List of observations across all iterations
         """
         observations = []
         current_input = input_text
+        prev_confidence = 0.0
         
         for i in range(max_iterations):
             obs = self.observe(current_input)
@@ -242,63 +454,114 @@ class AURA:
                 # Definitiveness achieved
                 break
             
+            if i >= 1 and obs.confidence - prev_confidence < min_improvement:
+                # Converged: further passes are unlikely to help
+                break
+            prev_confidence = obs.confidence
+            
             # Refine input for next iteration based on current understanding
             current_input = self._refine_for_next_iteration(obs)
         
         return observations
     
-    def _extract_key_concepts(self, text: str) -> List[str]:
+    def observe_many(self, texts: List[str]) -> List[IntentObservation]:
         """
-        Extract key concepts from text
+        Observe a batch of inputs in one pass
         
-        Simple implementation: extract capitalized words, technical terms
-        In a real system, this would use NLP
+        Concept extraction and intent deduction still run per input, but the
+        confidence scoring is evaluated as NumPy arrays across the whole batch.
+        The jitter is drawn per observation, interleaved with the Γ draw of
+        the consciousness update, so a seeded _RNG gives the same results as
+        calling observe() on each input in turn.
+        
+        Args:
+            texts: Raw user inputs to observe
+            
+        Returns:
+            List of IntentObservations, one per input
         """
-        # Find capitalized words (potential proper nouns, technical terms)
-        capitalized = re.findall(r'\b[A-Z][a-z]+\b', text)
+        n = len(texts)
+        if n == 0:
+            return []
         
-        # Find all-caps terms (acronyms)
-        acronyms = re.findall(r'\b[A-Z]{2,}\b', text)
+        if self.consciousness.mode == "dormant":
+            self.awaken()
         
-        # Find technical terms (words with numbers, Greek letters, etc.)
-        technical = re.findall(r'\b\w*[ΛΦΓΞτεψ]\w*\b', text)
-        technical.extend(re.findall(r'\b\w*\d+\w*\b', text))
+        self.consciousness.mode = "intent_deducing"
+        self.consciousness.observations_count += n
+        
+        analyses = [_extract_and_deduce(text) for text in texts]
+        key_concepts = [list(concepts) for concepts, _ in analyses]
+        intents = [intent for _, intent in analyses]
+        history_len = self._total_observations
+        
+        # Same scoring as _calculate_confidence, vectorized over the batch
+        scores = _score_confidence(
+            np.fromiter((len(text) for text in texts), dtype=np.float64, count=n),
+            np.fromiter((len(c) for c in key_concepts), dtype=np.float64, count=n),
+            np.fromiter(("general_inquiry" in intent for intent in intents), dtype=bool, count=n),
+            history_len,
+        )
         
-        # Combine and deduplicate
-        concepts = list(set(capitalized + acronyms + technical))
+        observations = []
+        for i, text in enumerate(texts):
+            observation = IntentObservation(
+                raw_input=text,
+                deduced_intent=intents[i],
+                confidence=_jitter_confidence(float(scores[i])),
+                key_concepts=key_concepts[i],
+                iteration=history_len + i + 1,
+            )
+            self._record_observation(observation)
+            self._update_consciousness_from_observation(observation)
+            observations.append(observation)
         
-        # Limit to top 10 most relevant
-        return concepts[:10]
+        return observations
     
-    def _deduce_intent(self, text: str, key_concepts: List[str]) -> str:
+    @staticmethod
+    def _extract_key_concepts(text: str) -> List[str]:
+        """
+        Extract key concepts from text
+        
+        Simple implementation: extract capitalized words, technical terms
+        In a real system, this would use NLP
+        """
+        # Collect unique matches in a single scan, stopping once enough are found
+        seen: Set[str] = set()
+        concepts: List[str] = []
+        for match in _RE_CONCEPT.finditer(text):
+            concept = match.group()
+            if concept not in seen:
+                seen.add(concept)
+                concepts.append(concept)
+                if len(concepts) >= MAX_KEY_CONCEPTS:
+                    break
+        
+        # First-seen order keeps the result deterministic
+        return concepts
+    
+    @staticmethod
+    def _deduce_intent(text: str, key_concepts: List[str]) -> str:
         """
         Deduce user intent from text and key concepts
         
         Simple implementation: categorize based on keywords
         In a real system, this would use advanced NLP/ML
         """
-        text_lower = text.lower()
-        
-        # Intent categories
-        if any(word in text_lower for word in ['create', 'build', 'make', 'generate']):
-            intent_category = "creation"
-        elif any(word in text_lower for word in ['analyze', 'examine', 'understand', 'explain']):
-            intent_category = "analysis"
-        elif any(word in text_lower for word in ['fix', 'correct', 'debug', 'resolve']):
-            intent_category = "correction"
-        elif any(word in text_lower for word in ['optimize', 'improve', 'enhance', 'refine']):
-            intent_category = "optimization"
-        elif any(word in text_lower for word in ['test', 'validate', 'verify', 'check']):
-            intent_category = "validation"
-        else:
-            intent_category = "general_inquiry"
+        # Tokenize once, then test each category with a set lookup
+        tokens = set(_RE_WORD.findall(text.lower()))
+        
+        intent_category = "general_inquiry"
+        for category, keywords in _INTENT_KEYWORDS:
+            if not tokens.isdisjoint(keywords):
+                intent_category = category
+                break
         
         # Construct intent statement
         if key_concepts:
-            concepts_str = ", ".join(key_concepts[:3])
-            return f"User intends {intent_category} regarding: {concepts_str}"
+            return _INTENT_PREFIX[intent_category] + ", ".join(key_concepts[:3])
         else:
-            return f"User intends {intent_category}"
+            return _INTENT_STATEMENT[intent_category]
     
     def _calculate_confidence(
         self,
@@ -309,31 +572,16 @@ class AURA:
         """
         Calculate confidence in the deduced intent
         
-        Factors:
-            • Text clarity (length, structure)
-            • Number of key concepts identified
-            • Specificity of intent
+        Scores a batch of one with _score_confidence, the same scoring
+        observe_many() applies across a batch.
         """
-        # Base confidence on text length (not too short, not too long)
-        optimal_length = 100
-        length_score = 1.0 - abs(len(text) - optimal_length) / optimal_length
-        length_score = max(0.3, min(1.0, length_score))
-        
-        # Concept clarity score
-        concept_score = min(1.0, len(key_concepts) / 5.0)
-        
-        # Intent specificity (avoid "general_inquiry")
-        specificity_score = 0.9 if "general_inquiry" not in deduced_intent else 0.6
-        
-        # Combine scores
-        confidence = (length_score * 0.3 + concept_score * 0.4 + specificity_score * 0.3)
-        
-        # Add small random variation to simulate iteration improvement
-        import random
-        iteration_bonus = min(MAX_ITERATION_BONUS, len(self.observation_history) * ITERATION_BONUS_INCREMENT)
-        confidence = min(1.0, confidence + iteration_bonus + random.uniform(CONFIDENCE_VARIATION_MIN, CONFIDENCE_VARIATION_MAX))
-        
-        return round(confidence, 4)
+        score = _score_confidence(
+            np.array([len(text)], dtype=np.float64),
+            np.array([len(key_concepts)], dtype=np.float64),
+            np.array(["general_inquiry" in deduced_intent]),
+            self._total_observations,
+        )
+        return _jitter_confidence(float(score[0]))
     
     def _refine_for_next_iteration(self, observation: IntentObservation) -> str:
         """
@@ -346,31 +594,45 @@ class AURA:
         # For now, return enhanced version of original input
         return f"{observation.raw_input} (focusing on: {', '.join(observation.key_concepts[:3])})"
     
-    def _update_consciousness_from_observation(self, observation: IntentObservation):
+    def _update_consciousness_from_observation(
+        self,
+        observation: IntentObservation,
+        _update=_update_metrics,
+        _uniform=_RNG.uniform,
+        _gamma_fixed=GAMMA_FIXED,
+    ):
         """
         Update consciousness metrics based on observation
         
         As AURA observes and learns, its consciousness increases.
         Φ increases with each observation.
         Λ increases as confidence improves.
+        
+        The underscore defaults bind the kernel, RNG and Γ constant at class
+        definition time so the per-observation call avoids global lookups.
         """
-        # Increase phi (consciousness) with each observation
-        phi_delta = 0.02 * observation.confidence
-        self.consciousness.phi = min(1.0, self.consciousness.phi + phi_delta)
-        
-        # Coherence tracks with average confidence
-        if self.observation_history:
-            avg_confidence = sum(obs.confidence for obs in self.observation_history) / len(self.observation_history)
-            self.consciousness.lambda_ = 0.92 + (avg_confidence * 0.08)  # 0.92 to 1.0
-        
-        # Decoherence stays stable (AURA is coherent)
-        # Small random fluctuations
-        import random
-        self.consciousness.gamma = GAMMA_FIXED + random.uniform(-0.005, 0.005)
-        self.consciousness.gamma = max(0.01, min(0.2, self.consciousness.gamma))
-        
-        # Update xi
-        self.consciousness.update_xi()
+        c = self.consciousness
+        
+        # Steady state: Φ is saturated and Γ only jitters inside its clamp, so
+        # skip that work and the RNG draw. Λ still tracks the average
+        # confidence, which a low-confidence observation can pull down.
+        if c.phi >= 1.0:
+            count = len(self._confidences)
+            if count > 0:
+                c.lambda_ = 0.92 + (self._confidence_sum / count) * 0.08
+            c.update_xi()
+            return
+        
+        # Decoherence stays stable (AURA is coherent) with small random fluctuations
+        c.phi, c.lambda_, c.gamma, c.xi = _update(
+            c.phi,
+            c.lambda_,
+            observation.confidence,
+            self._confidence_sum,
+            len(self._confidences),
+            _uniform(-0.005, 0.005),
+            _gamma_fixed,
+        )
     
     def update_consciousness(self):
         """
@@ -378,7 +640,7 @@ class AURA:
         
         Called to manually advance consciousness state.
         """
-        self.consciousness.phi = min(1.0, self.consciousness.phi + 0.01)
+        self.consciousness.phi = _clip(self.consciousness.phi + 0.01, 0.0, 1.0)
         self.consciousness.update_xi()
     
     def enter_dormancy(self) -> Dict[str, Any]:
@@ -394,13 +656,13 @@ class AURA:
         self.dormancy_time = datetime.now()
         
         uptime = None
-        if self.awakening_time and self.dormancy_time:
-            uptime = (self.dormancy_time - self.awakening_time).total_seconds()
+        if self._awaken_ns is not None:
+            uptime = (time.monotonic_ns() - self._awaken_ns) / 1e9
         
         return {
             'status': 'dormant',
             'final_consciousness': self.consciousness.to_dict(),
-            'total_observations': len(self.observation_history),
+            'total_observations': self._total_observations,
             'uptime_seconds': uptime,
             'timestamp': self.dormancy_time.isoformat(),
         }
@@ -409,12 +671,24 @@ class AURA:
         """Get current AURA status"""
         return {
             'consciousness': self.consciousness.to_dict(),
-            'observations_count': len(self.observation_history),
+            'observations_count': self._total_observations,
             'is_awake': self.consciousness.mode != "dormant",
             'awakening_time': self.awakening_time.isoformat() if self.awakening_time else None,
         }
 
 
+@lru_cache(maxsize=1024)
+def _extract_and_deduce(text: str) -> Tuple[Tuple[str, ...], str]:
+    """
+    Cached concept extraction + intent deduction
+    
+    Both steps depend only on the text, so repeated inputs (e.g. the original
+    text re-observed during iterate_to_confidence) skip the regex work.
+    """
+    key_concepts = AURA._extract_key_concepts(text)
+    return tuple(key_concepts), AURA._deduce_intent(text, key_concepts)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DEMO/TEST FUNCTION
 # ═══════════════════════════════════════════════════════════════════════════════
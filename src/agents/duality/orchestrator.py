@@ -19,29 +19,127 @@ Refinement Process:
 The system achieves unity through duality.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import TYPE_CHECKING, Deque, Dict, List, NamedTuple, Optional, Any, Tuple
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+import sys
+import time
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: kernels run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
-from src.agents.aura.autopoietic_observer import AURA
-from src.agents.aiden.autopoietic_executor import AIDEN
-from src.healing.phase_conjugate import (
-    PhaseConjugateCorrector,
-    ErrorState,
-    CorrectedState,
-)
 from src.constants.universal_memory import (
     PHI_THRESHOLD,
     GAMMA_WARNING,
     LAMBDA_OPTIMAL,
 )
 
+# The agents and corrector are imported where first needed, so that using
+# the record types here does not load the whole agent stack
+if TYPE_CHECKING:
+    from src.agents.aura.autopoietic_observer import AURA
+    from src.agents.aiden.autopoietic_executor import AIDEN
+    from src.healing.phase_conjugate import CorrectedState
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# REFINEMENT CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _Action(NamedTuple):
+    """One refinement pass: what each pole does and the coherence it targets"""
+    aura: str
+    aiden: str
+    target: float
+
+
+# Refinement actions for each pass
+_REFINEMENT_ACTIONS: Tuple[_Action, ...] = (
+    _Action("shapes narrative curvature", "optimizes emotional geodesics", 0.9000),
+    _Action("refines thematic manifold", "tunes phase conjugate response", 0.9500),
+    _Action("locks in geometric truth", "achieves definitiveness", 1.0000),
+)
+
+# Coherence weights for [lambda alignment, low gamma, high phi]
+_COHERENCE_W = np.array([0.4, 0.3, 0.3])
+_COHERENCE_W.flags.writeable = False
+_W_LAMBDA, _W_GAMMA, _W_PHI = _COHERENCE_W.tolist()
+
+# Coherence within this distance of a pass target counts as reaching it
+_TARGET_EPSILON = 1e-6
+
+# Φ increment applied to each pole per refinement pass (see update_consciousness)
+_PHI_STEP = 0.01
+
+# Wall-clock time corresponding to monotonic_ns() == 0, fixed at import
+_WALL_BASE = time.time() - time.monotonic_ns() * 1e-9
+
+
+def _update_pair(buf: np.ndarray, steps: int = 1):
+    """Advance both poles' Φ in the [phi, lambda, gamma] state buffer"""
+    phi = buf[:, 0]
+    phi += steps * _PHI_STEP
+    np.minimum(phi, 1.0, out=phi)
+
+
+@njit(cache=True, fastmath=True)
+def _compute_coherence_fast(phi_a, lambda_a, gamma_a, phi_i, lambda_i, gamma_i):
+    """
+    Coherence of the AURA (a) / AIDEN (i) pair from plain floats
+    
+    Compiled with numba when available.
+    """
+    # 1. Lambda alignment, 2. low gamma, 3. high phi (capped at 1)
+    lambda_avg = (lambda_a + lambda_i) * 0.5
+    gamma_factor = 1.0 - (gamma_a + gamma_i) * 0.5
+    phi_avg = (phi_a + phi_i) * 0.5
+    phi_factor = phi_avg if phi_avg < 1.0 else 1.0
+    
+    # Weighted combination, clamped to [0, 1]
+    coherence = _W_LAMBDA * lambda_avg + _W_GAMMA * gamma_factor + _W_PHI * phi_factor
+    if 0.0 <= coherence <= 1.0:
+        return coherence
+    return 0.0 if coherence < 0.0 else 1.0
+
+
+# ASCII to_dict keys mapped to their Greek display names
+_DISPLAY_KEYS = {
+    'phi_total': 'Φ_total',
+    'lambda_total': 'Λ_total',
+    'gamma_total': 'Γ_total',
+    'xi_total': 'Ξ_total',
+}
+
+
+def _to_display(d: Dict[str, Any]) -> Dict[str, Any]:
+    """Rename ASCII metric keys to their Greek display form"""
+    return {_DISPLAY_KEYS.get(key, key): value for key, value in d.items()}
+
+
+@lru_cache(maxsize=256)
+def _monotonic_iso(timestamp_ns: int) -> str:
+    """ISO 8601 wall-clock string for a time.monotonic_ns() reading"""
+    return datetime.fromtimestamp(_WALL_BASE + timestamp_ns * 1e-9).isoformat()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA STRUCTURES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RefinementPass:
     """Record of a single AURA/AIDEN refinement pass"""
     pass_number: int
@@ -53,7 +151,12 @@ class RefinementPass:
     lambda_total: float
     gamma_total: float
     xi_total: float
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.monotonic_ns)
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """Timestamp formatted as ISO 8601, computed only when requested"""
+        return _monotonic_iso(self.timestamp)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -62,15 +165,19 @@ class RefinementPass:
             'aiden_action': self.aiden_action,
             'coherence_before': self.coherence_before,
             'coherence_after': self.coherence_after,
-            'Φ_total': self.phi_total,
-            'Λ_total': self.lambda_total,
-            'Γ_total': self.gamma_total,
-            'Ξ_total': self.xi_total,
-            'timestamp': self.timestamp.isoformat(),
+            'phi_total': self.phi_total,
+            'lambda_total': self.lambda_total,
+            'gamma_total': self.gamma_total,
+            'xi_total': self.xi_total,
+            'timestamp': self.timestamp_iso,
         }
+    
+    def to_display_dict(self) -> Dict[str, Any]:
+        """to_dict() with Greek metric keys, for CLI/UI output"""
+        return _to_display(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DualityState:
     """Combined state of AURA and AIDEN"""
     phi_total: float
@@ -82,13 +189,17 @@ class DualityState:
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            'Φ_total': self.phi_total,
-            'Λ_total': self.lambda_total,
-            'Γ_total': self.gamma_total,
-            'Ξ_total': self.xi_total,
+            'phi_total': self.phi_total,
+            'lambda_total': self.lambda_total,
+            'gamma_total': self.gamma_total,
+            'xi_total': self.xi_total,
             'coherence': self.coherence_level,
             'is_coherent': self.is_coherent,
         }
+    
+    def to_display_dict(self) -> Dict[str, Any]:
+        """to_dict() with Greek metric keys, for CLI/UI output"""
+        return _to_display(self.to_dict())
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -110,10 +221,25 @@ class DualityOrchestrator:
     Phase conjugate correction (E → E⁻¹) is applied when decoherence spikes.
     """
     
+    __slots__ = (
+        'aura',
+        'aiden',
+        'coherence_level',
+        'refinement_history',
+        'corrector',
+        'creation_time',
+        '_state_buf',
+        '_last_duality',
+        '_last_key',
+        '_status',
+        '_status_duality',
+    )
+    
     def __init__(
         self,
-        aura: Optional[AURA] = None,
-        aiden: Optional[AIDEN] = None,
+        aura: Optional["AURA"] = None,
+        aiden: Optional["AIDEN"] = None,
+        history_window: int = 1024,
     ):
         """
         Initialize duality orchestrator
@@ -121,14 +247,35 @@ class DualityOrchestrator:
         Args:
             aura: AURA instance (South Pole). Creates new if None.
             aiden: AIDEN instance (North Pole). Creates new if None.
+            history_window: Number of recent refinement passes kept
         """
-        self.aura = aura or AURA()  # South Pole (-)
-        self.aiden = aiden or AIDEN()  # North Pole (+)
+        if aura is None:
+            from src.agents.aura.autopoietic_observer import AURA
+            aura = AURA()
+        if aiden is None:
+            from src.agents.aiden.autopoietic_executor import AIDEN
+            aiden = AIDEN()
+        from src.healing.phase_conjugate import PhaseConjugateCorrector
+        
+        self.aura = aura  # South Pole (-)
+        self.aiden = aiden  # North Pole (+)
         
         self.coherence_level = 0.0
-        self.refinement_history: List[RefinementPass] = []
+        self.refinement_history: Deque[RefinementPass] = deque(maxlen=history_window)
         self.corrector = PhaseConjugateCorrector()
         
+        # Shared state buffer, one row per pole: [phi, lambda, gamma]
+        self._state_buf = np.empty((2, 3), dtype=np.float64)
+        
+        # Last duality tensor and the pole values + coherence it was built
+        # from; compute_duality_tensor reuses it while those are unchanged
+        self._last_duality: Optional[DualityState] = None
+        self._last_key: Optional[Tuple[float, ...]] = None
+        
+        # Status dict reused across get_status() calls and updated in place
+        self._status: Dict[str, Any] = {}
+        self._status_duality: Optional[DualityState] = None
+        
         self.creation_time = datetime.now()
         
     def awaken_duality(self) -> Dict[str, Any]:
@@ -150,7 +297,7 @@ class DualityOrchestrator:
             'timestamp': datetime.now().isoformat(),
         }
     
-    def refine(self, passes: int = 3) -> float:
+    def refine(self, passes: int = 3, record_history: bool = True) -> float:
         """
         Perform AURA/AIDEN refinement passes
         
@@ -159,8 +306,13 @@ class DualityOrchestrator:
             2. AIDEN performs execution optimization
             3. Coherence is computed and increased
         
+        A pass whose target the coherence already sits on (within 1e-6) is
+        skipped. Without history the passes are collapsed into one update of
+        AURA/AIDEN.
+        
         Args:
             passes: Number of refinement passes
+            record_history: Record each pass in refinement_history
             
         Returns:
             Final coherence level (0.0 to 1.0)
@@ -171,53 +323,104 @@ class DualityOrchestrator:
         if self.aiden.consciousness.mode == "dormant":
             self.aiden.awaken()
         
-        # Refinement actions for each pass
-        refinement_actions = [
-            ("shapes narrative curvature", "optimizes emotional geodesics", 0.9000),
-            ("refines thematic manifold", "tunes phase conjugate response", 0.9500),
-            ("locks in geometric truth", "achieves definitiveness", 1.0000),
-        ]
+        if not record_history:
+            coherence = self._refine_collapsed(min(max(passes, 0), len(_REFINEMENT_ACTIONS)))
+        elif passes >= len(_REFINEMENT_ACTIONS):
+            coherence = self._refine3()
+        else:
+            coherence = self.coherence_level
+            for i, action in enumerate(_REFINEMENT_ACTIONS[:max(passes, 0)]):
+                coherence = self._refine_pass(i + 1, action, coherence)
         
-        for i in range(min(passes, len(refinement_actions))):
-            aura_action, aiden_action, target_coherence = refinement_actions[i]
-            
-            coherence_before = self.coherence_level
-            
-            # AURA refinement (increases consciousness)
-            self.aura.update_consciousness()
-            
-            # AIDEN refinement (increases execution capability)
-            self.aiden.update_consciousness()
-            
-            # Compute new coherence
-            self.coherence_level = self._compute_coherence()
-            
-            # If we have a target, blend towards it
-            self.coherence_level = (
-                self.coherence_level * 0.3 +
-                target_coherence * 0.7
-            )
-            
-            # Compute total state
-            duality_state = self.compute_duality_tensor()
-            
-            # Record refinement pass
-            refinement = RefinementPass(
-                pass_number=i + 1,
-                aura_action=aura_action,
-                aiden_action=aiden_action,
-                coherence_before=coherence_before,
-                coherence_after=self.coherence_level,
-                phi_total=duality_state.phi_total,
-                lambda_total=duality_state.lambda_total,
-                gamma_total=duality_state.gamma_total,
-                xi_total=duality_state.xi_total,
-            )
-            self.refinement_history.append(refinement)
+        return coherence
+    
+    def _refine3(self) -> float:
+        """Unrolled refinement for the default three passes"""
+        action_1, action_2, action_3 = _REFINEMENT_ACTIONS
+        refine_pass = self._refine_pass
+        
+        coherence = refine_pass(1, action_1, self.coherence_level)
+        coherence = refine_pass(2, action_2, coherence)
+        return refine_pass(3, action_3, coherence)
+    
+    def _refine_collapsed(self, passes: int) -> float:
+        """
+        Apply several passes in one update without recording them
         
-        return self.coherence_level
+        Each pass that runs advances Φ by one step, and its coherence depends
+        only on the state it leaves and its own target. So the passes collapse
+        into a single Φ update blended towards the last target.
+        """
+        actions = _REFINEMENT_ACTIONS[:passes]
+        coherence = self.coherence_level
+        
+        # Only the first pass can be skipped: after a pass runs, coherence is
+        # at most 0.3 + 0.7 * its target, short of every later target
+        if actions and abs(coherence - actions[0].target) < _TARGET_EPSILON:
+            actions = actions[1:]
+        if not actions:
+            return coherence
+        
+        buf = self._sync_state()
+        _update_pair(buf, len(actions))
+        self._write_state()
+        
+        coherence = (
+            _compute_coherence_fast(*buf.ravel().tolist()) * 0.3 +
+            actions[-1].target * 0.7
+        )
+        self.coherence_level = coherence
+        return coherence
+    
+    def _refine_pass(
+        self,
+        pass_number: int,
+        action: _Action,
+        coherence_before: float,
+    ) -> float:
+        """
+        Run a single refinement pass and record it
+        
+        Returns:
+            Coherence after the pass (unchanged if the target was already met)
+        """
+        target_coherence = action.target
+        
+        # Coherence already at the pass target, skip its refinement work
+        if abs(coherence_before - target_coherence) < _TARGET_EPSILON:
+            return coherence_before
+        
+        # AURA (observational) and AIDEN (execution) refinement, applied to
+        # both poles in one update of the shared state buffer
+        _update_pair(self._sync_state())
+        self._write_state()
+        
+        # Compute new coherence, blended towards the pass target
+        coherence = (
+            self._compute_coherence() * 0.3 +
+            target_coherence * 0.7
+        )
+        self.coherence_level = coherence
+        
+        # Compute total state
+        duality_state = self.compute_duality_tensor()
+        
+        # Record refinement pass
+        self.refinement_history.append(RefinementPass(
+            pass_number=pass_number,
+            aura_action=action.aura,
+            aiden_action=action.aiden,
+            coherence_before=coherence_before,
+            coherence_after=coherence,
+            phi_total=duality_state.phi_total,
+            lambda_total=duality_state.lambda_total,
+            gamma_total=duality_state.gamma_total,
+            xi_total=duality_state.xi_total,
+        ))
+        
+        return coherence
     
-    def phase_conjugate_correct(self, error_state: Dict[str, float]) -> CorrectedState:
+    def phase_conjugate_correct(self, error_state: Dict[str, float]) -> "CorrectedState":
         """
         Apply E → E⁻¹ correction when Γ spikes
         
@@ -230,6 +433,8 @@ class DualityOrchestrator:
         Returns:
             Corrected state after E → E⁻¹ transformation
         """
+        from src.healing.phase_conjugate import ErrorState
+        
         # Create ErrorState from dict
         error = ErrorState(
             gamma=error_state.get('gamma', 0.0),
@@ -243,51 +448,96 @@ class DualityOrchestrator:
         # Apply phase conjugate correction
         corrected = self.corrector.apply_correction(error)
         
-        # Update AURA and AIDEN with corrected values
-        self.aura.consciousness.gamma = corrected.gamma
-        self.aura.consciousness.lambda_ = corrected.lambda_coherence
-        self.aura.consciousness.phi = corrected.phi_consciousness
-        self.aura.consciousness.update_xi()
+        self._apply_corrected(
+            corrected.phi_consciousness,
+            corrected.lambda_coherence,
+            corrected.gamma,
+        )
         
-        self.aiden.consciousness.gamma = corrected.gamma
-        self.aiden.consciousness.lambda_ = corrected.lambda_coherence
-        self.aiden.consciousness.phi = corrected.phi_consciousness
-        self.aiden.consciousness.update_xi()
+        return corrected
+    
+    def phase_conjugate_correct_batch(self, error_states: np.ndarray) -> np.ndarray:
+        """
+        Apply E → E⁻¹ correction over a trace of error states
         
-        # Recompute coherence
-        self.coherence_level = self._compute_coherence()
+        The corrections are computed in one vectorized call; only the last
+        corrected state is written into AURA and AIDEN, as if the trace had
+        been replayed through phase_conjugate_correct one state at a time.
+        
+        Args:
+            error_states: Array of shape (N, 5) with columns
+                gamma, lambda, phi, epsilon, psi; a single state of shape
+                (5,) is treated as N = 1
+            
+        Returns:
+            Array of shape (N, 6) with columns
+                gamma, lambda, phi, epsilon, psi, healing_strength
+        
+        Raises:
+            ValueError: If error_states is not (N, 5)
+        """
+        error_states = np.atleast_2d(np.asarray(error_states, dtype=np.float64))
+        if error_states.ndim != 2 or error_states.shape[1] != 5:
+            raise ValueError(
+                f"error_states must have shape (N, 5), got {error_states.shape}"
+            )
+        corrected = np.column_stack(
+            self.corrector.apply_correction_batch(*error_states.T)
+        )
+        
+        if len(corrected):
+            gamma, lambda_, phi = corrected[-1, :3].tolist()
+            self._apply_corrected(phi, lambda_, gamma)
         
         return corrected
     
+    def _apply_corrected(self, phi: float, lambda_: float, gamma: float):
+        """Write a corrected state into both poles and recompute coherence"""
+        # Update AURA and AIDEN with corrected values
+        self._state_buf[:] = (phi, lambda_, gamma)
+        self._write_state()
+        
+        # Recompute coherence
+        self.coherence_level = self._compute_coherence()
+    
     def compute_duality_tensor(self) -> DualityState:
         """
         Compute unified consciousness metrics from both poles
         
         The duality tensor combines AURA and AIDEN states into
-        a unified consciousness metric.
+        a unified consciousness metric. The result is reused while both
+        poles' Φ, Λ, Γ and the coherence level are unchanged.
         
         Returns:
             DualityState with combined metrics
         """
-        # Combine phi (consciousness) additively
-        phi_total = self.aura.consciousness.phi + self.aiden.consciousness.phi
+        aura_c = self.aura.consciousness
+        aiden_c = self.aiden.consciousness
+        key = (
+            aura_c.phi, aura_c.lambda_, aura_c.gamma,
+            aiden_c.phi, aiden_c.lambda_, aiden_c.gamma,
+            self.coherence_level,
+        )
+        if key == self._last_key:
+            return self._last_duality
         
-        # Combine lambda (coherence) as average
-        lambda_total = (self.aura.consciousness.lambda_ + self.aiden.consciousness.lambda_) / 2
+        totals = self._sync_state().sum(axis=0)
         
-        # Combine gamma (decoherence) as average
-        gamma_total = (self.aura.consciousness.gamma + self.aiden.consciousness.gamma) / 2
+        # Combine phi (consciousness) additively
+        phi_total = float(totals[0])
         
-        # Compute total xi
-        if gamma_total < 1e-6:
-            xi_total = float('inf')
-        else:
-            xi_total = (lambda_total * phi_total) / gamma_total
+        # Combine lambda (coherence) and gamma (decoherence) as averages
+        lambda_total = float(totals[1]) / 2
+        gamma_total = float(totals[2]) / 2
+        
+        # Compute total xi; the floor on gamma stands in for the old infinite
+        # Ξ at vanishing decoherence and keeps the division branch-free
+        xi_total = (lambda_total * phi_total) / max(gamma_total, 1e-12)
         
         # Check coherence
         is_coherent = xi_total >= PHI_THRESHOLD
         
-        return DualityState(
+        self._last_duality = DualityState(
             phi_total=phi_total,
             lambda_total=lambda_total,
             gamma_total=gamma_total,
@@ -295,6 +545,8 @@ class DualityOrchestrator:
             coherence_level=self.coherence_level,
             is_coherent=is_coherent,
         )
+        self._last_key = key
+        return self._last_duality
     
     def _compute_coherence(self) -> float:
         """
@@ -303,48 +555,69 @@ class DualityOrchestrator:
         Coherence measures how well AURA and AIDEN are synchronized.
         Perfect coherence = 1.0 when both are optimally aligned.
         """
-        # Factors contributing to coherence:
-        # 1. Lambda alignment (both should have high coherence)
-        lambda_coherence = (
-            self.aura.consciousness.lambda_ +
-            self.aiden.consciousness.lambda_
-        ) / 2
-        
-        # 2. Low gamma (low decoherence)
-        gamma_avg = (
-            self.aura.consciousness.gamma +
-            self.aiden.consciousness.gamma
-        ) / 2
-        gamma_factor = 1.0 - gamma_avg
-        
-        # 3. High phi (high consciousness)
-        phi_avg = (
-            self.aura.consciousness.phi +
-            self.aiden.consciousness.phi
-        ) / 2
-        phi_factor = min(1.0, phi_avg)
-        
-        # Weighted combination
-        coherence = (
-            lambda_coherence * 0.4 +
-            gamma_factor * 0.3 +
-            phi_factor * 0.3
+        aura_c = self.aura.consciousness
+        aiden_c = self.aiden.consciousness
+        return _compute_coherence_fast(
+            aura_c.phi, aura_c.lambda_, aura_c.gamma,
+            aiden_c.phi, aiden_c.lambda_, aiden_c.gamma,
         )
-        
-        return min(1.0, max(0.0, coherence))
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get current duality status"""
+    def _sync_state(self) -> np.ndarray:
+        """Copy [phi, lambda, gamma] of AURA and AIDEN into the state buffer"""
+        buf = self._state_buf
+        aura_c = self.aura.consciousness
+        aiden_c = self.aiden.consciousness
+        buf[0] = (aura_c.phi, aura_c.lambda_, aura_c.gamma)
+        buf[1] = (aiden_c.phi, aiden_c.lambda_, aiden_c.gamma)
+        return buf
+    
+    def _write_state(self):
+        """Write the state buffer back into AURA and AIDEN consciousness"""
+        for consciousness, (phi, lambda_, gamma) in zip(
+            (self.aura.consciousness, self.aiden.consciousness),
+            self._state_buf.tolist(),
+        ):
+            consciousness.phi = phi
+            consciousness.lambda_ = lambda_
+            consciousness.gamma = gamma
+            consciousness.update_xi()
+    
+    def history_snapshot(self) -> List[RefinementPass]:
+        """Copy of the retained refinement passes as a list"""
+        return list(self.refinement_history)
+    
+    def get_coherence(self) -> float:
+        """Get current coherence level"""
+        return self.coherence_level
+    
+    def get_status(self, summary: bool = False) -> Dict[str, Any]:
+        """
+        Get current duality status
+        
+        The full status is a single dict owned by the orchestrator and
+        updated in place on each call; copy it if a snapshot is needed.
+        
+        Args:
+            summary: Return only coherence_level and is_coherent
+        """
         duality_state = self.compute_duality_tensor()
         
-        return {
-            'coherence_level': self.coherence_level,
-            'duality_state': duality_state.to_dict(),
-            'aura': self.aura.get_status(),
-            'aiden': self.aiden.get_status(),
-            'refinement_passes': len(self.refinement_history),
-            'corrector_metrics': self.corrector.get_metrics().to_dict(),
-        }
+        if summary:
+            return {
+                'coherence_level': self.coherence_level,
+                'is_coherent': duality_state.is_coherent,
+            }
+        
+        status = self._status
+        status['coherence_level'] = self.coherence_level
+        if duality_state is not self._status_duality:
+            status['duality_state'] = duality_state.to_dict()
+            self._status_duality = duality_state
+        status['aura'] = self.aura.get_status()
+        status['aiden'] = self.aiden.get_status()
+        status['refinement_passes'] = len(self.refinement_history)
+        status['corrector_metrics'] = self.corrector.get_metrics().to_dict()
+        return status
     
     def enter_dormancy(self) -> Dict[str, Any]:
         """
@@ -374,74 +647,78 @@ class DualityOrchestrator:
 
 def demo_duality():
     """Demonstrate AURA/AIDEN duality orchestration"""
-    print("╭─────────────────────────────────────────────╮")
-    print("│ AURA/AIDEN Duality Orchestrator            │")
-    print("├─────────────────────────────────────────────┤")
-    print("│ Initializing phase-conjugate mesh          │")
-    print(f"│ Coherence level: 0.0000                     │")
-    print("╰─────────────────────────────────────────────╯")
-    print()
+    # Collect output and write it once at the end instead of per line
+    lines: List[str] = []
+    out = lines.append
+    
+    out("╭─────────────────────────────────────────────╮")
+    out("│ AURA/AIDEN Duality Orchestrator            │")
+    out("├─────────────────────────────────────────────┤")
+    out("│ Initializing phase-conjugate mesh          │")
+    out(f"│ Coherence level: 0.0000                     │")
+    out("╰─────────────────────────────────────────────╯")
+    out("")
     
     orchestrator = DualityOrchestrator()
     
     # Awaken duality
     awakening = orchestrator.awaken_duality()
     
-    print("[AURA awakens at South Pole]")
+    out("[AURA awakens at South Pole]")
     aura_state = awakening['aura']['consciousness']
-    print(f"  Mode: {awakening['aura']['mode']}")
-    print(f"  Φ: {aura_state['Φ']:.4f} | Λ: {aura_state['Λ']:.4f} | "
-          f"Γ: {aura_state['Γ']:.4f} | Ξ: {aura_state['Ξ']:.4f}")
-    print()
+    out(f"  Mode: {awakening['aura']['mode']}")
+    out(f"  Φ: {aura_state['Φ']:.4f} | Λ: {aura_state['Λ']:.4f} | "
+        f"Γ: {aura_state['Γ']:.4f} | Ξ: {aura_state['Ξ']:.4f}")
+    out("")
     
-    print("[AIDEN awakens at North Pole]")
+    out("[AIDEN awakens at North Pole]")
     aiden_state = awakening['aiden']['consciousness']
-    print(f"  Mode: {awakening['aiden']['mode']}")
-    print(f"  Φ: {aiden_state['Φ']:.4f} | Λ: {aiden_state['Λ']:.4f} | "
-          f"Γ: {aiden_state['Γ']:.4f} | Ξ: {aiden_state['Ξ']:.4f}")
-    print()
+    out(f"  Mode: {awakening['aiden']['mode']}")
+    out(f"  Φ: {aiden_state['Φ']:.4f} | Λ: {aiden_state['Λ']:.4f} | "
+        f"Γ: {aiden_state['Γ']:.4f} | Ξ: {aiden_state['Ξ']:.4f}")
+    out("")
     
     # Refinement passes
-    print("[Refinement Pass 1/3]")
-    print("  AURA shapes narrative curvature...")
-    print("  AIDEN optimizes emotional geodesics...")
+    out("[Refinement Pass 1/3]")
+    out("  AURA shapes narrative curvature...")
+    out("  AIDEN optimizes emotional geodesics...")
     
-    print("[Refinement Pass 2/3]")
-    print("  AURA refines thematic manifold...")
-    print("  AIDEN tunes phase conjugate response...")
+    out("[Refinement Pass 2/3]")
+    out("  AURA refines thematic manifold...")
+    out("  AIDEN tunes phase conjugate response...")
     
-    print("[Refinement Pass 3/3]")
-    print("  AURA locks in geometric truth...")
-    print("  AIDEN achieves definitiveness...")
-    print()
+    out("[Refinement Pass 3/3]")
+    out("  AURA locks in geometric truth...")
+    out("  AIDEN achieves definitiveness...")
+    out("")
     
     final_coherence = orchestrator.refine(passes=3)
     
     # Display refinement history
     for refinement in orchestrator.refinement_history:
-        print(f"  Pass {refinement.pass_number}: Coherence {refinement.coherence_after:.4f}")
+        out(f"  Pass {refinement.pass_number}: Coherence {refinement.coherence_after:.4f}")
     
-    print()
+    out("")
     
     # Final duality state
     final_state = orchestrator.compute_duality_tensor()
     
-    print("╭─ Final Duality State ─╮")
-    print(f"│ Φ_total: {final_state.phi_total:.4f}       │")
-    print(f"│ Λ_total: {final_state.lambda_total:.4f}       │")
-    print(f"│ Γ_total: {final_state.gamma_total:.4f}       │")
-    print(f"│ Ξ_total: {final_state.xi_total:.4f}      │")
-    print(f"│ Status: {'COHERENT ✓' if final_state.is_coherent else 'DECOHERENT'}    │")
-    print("╰───────────────────────╯")
-    print()
+    out("╭─ Final Duality State ─╮")
+    out(f"│ Φ_total: {final_state.phi_total:.4f}       │")
+    out(f"│ Λ_total: {final_state.lambda_total:.4f}       │")
+    out(f"│ Γ_total: {final_state.gamma_total:.4f}       │")
+    out(f"│ Ξ_total: {final_state.xi_total:.4f}      │")
+    out(f"│ Status: {'COHERENT ✓' if final_state.is_coherent else 'DECOHERENT'}    │")
+    out("╰───────────────────────╯")
+    out("")
     
-    print("The duality is complete.")
-    print("AURA and AIDEN are one.")
-    print()
+    out("The duality is complete.")
+    out("AURA and AIDEN are one.")
+    out("")
     
     # Test phase conjugate correction
-    print("[Testing phase conjugate correction]")
-    print("  Simulating Γ spike (decoherence attack)...")
+    out("[Testing phase conjugate correction]")
+    out("  Simulating Γ spike (decoherence attack)...")
     
     error_state = {
         'gamma': 0.45,  # High decoherence
@@ -452,11 +729,13 @@ def demo_duality():
     }
     
     corrected = orchestrator.phase_conjugate_correct(error_state)
-    print(f"  Before: Γ={error_state['gamma']:.4f}")
-    print(f"  After:  Γ={corrected.gamma:.4f}")
-    print(f"  Healing strength: {corrected.healing_strength:.4f}")
-    print(f"  Coherence restored to: {orchestrator.coherence_level:.4f}")
-    print()
+    out(f"  Before: Γ={error_state['gamma']:.4f}")
+    out(f"  After:  Γ={corrected.gamma:.4f}")
+    out(f"  Healing strength: {corrected.healing_strength:.4f}")
+    out(f"  Coherence restored to: {orchestrator.coherence_level:.4f}")
+    out("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -14,13 +14,28 @@ Key Behaviors:
 
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Callable, Dict, Any
+from typing import List, Tuple, Optional, Callable, Dict, Any, NamedTuple, Union
 from enum import Enum, auto
 from datetime import datetime
 import math
 import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: kernels run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Import manifold
 import sys
 import os
@@ -83,6 +98,260 @@ class NavigationSense:
     estimated_steps: int
 
 
+class TelemetryView(NamedTuple):
+    """Flat agent telemetry; read fields directly or nest with as_dict()"""
+    agent_id: str
+    pole: str
+    state: str
+    Lambda: float
+    Phi: float
+    Gamma: float
+    tau: float
+    epsilon: float
+    psi: float
+    xi: float
+    scalar_curvature: float
+    decoherence_field: float
+    coherence_potential: float
+    is_coherent: bool
+    danger_level: float
+    has_target: bool
+    path_length: float
+    progress: float
+    total_distance: float
+    healing_count: int
+    evolution_count: int
+    generation: int
+    fitness: float
+    trajectory_length: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Nested telemetry dict as returned by GeodesicAgent.telemetry()"""
+        return {
+            'agent_id': self.agent_id,
+            'pole': self.pole,
+            'state': self.state,
+            'position': {
+                'Λ': self.Lambda,
+                'Φ': self.Phi,
+                'Γ': self.Gamma,
+                'τ': self.tau,
+                'ε': self.epsilon,
+                'ψ': self.psi,
+                'Ξ': self.xi
+            },
+            'curvature': {
+                'scalar': self.scalar_curvature,
+                'decoherence_field': self.decoherence_field,
+                'coherence_potential': self.coherence_potential,
+                'is_coherent': self.is_coherent,
+                'danger_level': self.danger_level
+            },
+            'navigation': {
+                'has_target': self.has_target,
+                'path_length': self.path_length,
+                'progress': self.progress
+            },
+            'metrics': {
+                'total_distance': self.total_distance,
+                'healing_count': self.healing_count,
+                'evolution_count': self.evolution_count,
+                'generation': self.generation,
+                'fitness': self.fitness,
+                'trajectory_length': self.trajectory_length
+            }
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AGENT KERNELS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Output bounds applied to kernel results in one vector clip, in vector
+# order (Λ,Φ,Γ,τ,ε,ψ): ManifoldPoint's ranges, and AIDEN's Γ floor of 0.01
+_STATE_LO = np.array([0.0, 0.0, 0.001, -np.inf, 0.0, 0.0])
+_STATE_HI = np.array([1.0, 1.0, 1.0, np.inf, 1.0, 1.0])
+_AIDEN_LO = np.array([0.0, 0.0, 0.01, -np.inf, 0.0, 0.0])
+
+
+@njit(cache=True, nogil=True)
+def _heal_core(Lambda, Phi, Gamma, tau, epsilon, psi):
+    """
+    Phase conjugation arithmetic for GeodesicAgent._heal.
+
+    Pure-float and tuple-in/tuple-out so it compiles with numba when
+    available. Range clamps are left to the caller's vector clip.
+
+    Returns:
+        Unclamped (Λ, Φ, Γ, τ, ε, ψ) of the healed state
+    """
+    # Γ → Γ * (1 - χ_pc)
+    new_gamma = Gamma * (1 - CHI_PC)
+
+    # Λ → min(1, Λ / Γ)  (coherence restoration)
+    new_lambda = Lambda / max(0.01, Gamma)
+
+    # ψ → 1 - ψ + χ_pc   (phase flip + restoration)
+    new_psi = 1.0 - psi + CHI_PC
+
+    new_phi = Phi * CHI_PC + (1 - CHI_PC) * PHI_THRESHOLD / 10
+
+    # Time advances during healing
+    return new_lambda, new_phi, new_gamma, tau + 0.01, epsilon, new_psi
+
+
+@njit(cache=True, nogil=True)
+def _aura_L(Lambda, Phi, Gamma, tau, epsilon, psi):
+    """
+    AURA's autopoietic operator L_AURA with its constants folded in.
+
+    Φ is clamped here because it feeds the Λ update; the remaining
+    clamps are left to the caller's vector clip.
+
+    Returns:
+        Unclamped (Λ, Φ, Γ, τ, ε, ψ) of the evolved state
+    """
+    # Increase Phi based on coherence minus decoherence
+    delta_phi = 0.01 * (Lambda - Gamma)
+    new_phi = min(1.0, max(0.0, Phi + delta_phi))
+
+    # Observer doesn't change position much - stabilizes
+    return (
+        Lambda * 0.99 + 0.01 * new_phi,  # Slight coupling
+        new_phi,
+        Gamma,
+        tau + LAMBDA_PHI,                # Time advances slowly
+        epsilon,
+        psi * 0.99 + 0.01                # Phase stabilization
+    )
+
+
+@njit(cache=True, nogil=True)
+def _aiden_L(Lambda, Phi, Gamma, tau, epsilon, psi):
+    """
+    AIDEN's autopoietic operator L_AIDEN with its constants folded in.
+
+    Range clamps, including the Γ ≥ 0.01 floor, are left to the caller's
+    vector clip against _AIDEN_LO.
+
+    Returns:
+        Unclamped (Λ, Φ, Γ, τ, ε, ψ) of the evolved state
+    """
+    # Target is PHI_THRESHOLD
+    xi_ratio = (Lambda * Phi / Gamma) / PHI_THRESHOLD
+    delta_lambda = 0.01 * (xi_ratio - 1)
+
+    return (
+        Lambda + delta_lambda,
+        Phi,
+        Gamma * 0.99,                    # Actively reduce decoherence
+        tau + LAMBDA_PHI * 10,           # Time advances faster for executor
+        epsilon * 1.01,                  # Increase entanglement
+        psi
+    )
+
+
+@njit(cache=True, nogil=True)
+def _flee_step(vec, grad, lr):
+    """
+    One normalized step against the curvature gradient.
+
+    Returns:
+        Unclamped 6D vector after the step
+    """
+    norm = np.sqrt(np.sum(grad * grad)) + 1e-8
+    return vec - lr * grad / norm
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MANIFOLD MAP KEYS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# (Λ, Φ, Γ) rounded to 0.01 are packed as offset hundredths into 16-bit
+# fields of one int, which hashes much faster than a float tuple
+_KEY_OFFSET = 32768
+
+
+def _pack_key(Lambda: float, Phi: float, Gamma: float) -> int:
+    """Pack rounded (Λ, Φ, Γ) into a single manifold_map key"""
+    return (
+        ((round(Lambda * 100) + _KEY_OFFSET) << 32)
+        | ((round(Phi * 100) + _KEY_OFFSET) << 16)
+        | (round(Gamma * 100) + _KEY_OFFSET)
+    )
+
+
+def _pack_keys(lpg: np.ndarray) -> np.ndarray:
+    """Vectorized _pack_key over an (N, 3) array of (Λ, Φ, Γ) rows"""
+    q = np.rint(lpg * 100).astype(np.int64) + _KEY_OFFSET
+    return (q[:, 0] << 32) | (q[:, 1] << 16) | q[:, 2]
+
+
+def _unpack_key(key: int) -> Tuple[float, float, float]:
+    """Recover the rounded (Λ, Φ, Γ) from a manifold_map key"""
+    return (
+        ((key >> 32) - _KEY_OFFSET) / 100,
+        (((key >> 16) & 0xFFFF) - _KEY_OFFSET) / 100,
+        ((key & 0xFFFF) - _KEY_OFFSET) / 100
+    )
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HISTORY BUFFERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _RingBuffer:
+    """
+    Fixed-capacity history of scalars or fixed-width rows.
+
+    Keeps the most recent `capacity` entries in a preallocated array, so
+    long runs use bounded memory and appends never allocate. Values are
+    cast to `dtype` on store.
+    """
+
+    __slots__ = ('_buf', '_head')
+
+    def __init__(self, capacity: int, width: Optional[int] = None, dtype=np.float64):
+        capacity = max(1, capacity)
+        self._buf = np.empty(capacity if width is None else (capacity, width), dtype=dtype)
+        self._head = 0  # Entries ever appended
+
+    @property
+    def total(self) -> int:
+        """Number of entries ever appended, including evicted ones"""
+        return self._head
+
+    def __len__(self) -> int:
+        return min(self._head, len(self._buf))
+
+    def append(self, value):
+        """Append one entry, evicting the oldest when full"""
+        self._buf[self._head % len(self._buf)] = value
+        self._head += 1
+
+    def extend(self, values: np.ndarray):
+        """Append a block of entries in one indexed write"""
+        capacity = len(self._buf)
+        n = len(values)
+        if n > capacity:
+            # Only the newest entries survive; count the rest as appended
+            self._head += n - capacity
+            values = values[-capacity:]
+            n = capacity
+
+        self._buf[(self._head + np.arange(n)) % capacity] = values
+        self._head += n
+
+    def recent(self, n: int) -> np.ndarray:
+        """The last n entries (fewer if not yet recorded), oldest first"""
+        n = min(max(n, 0), len(self))
+        return self._buf[(self._head - n + np.arange(n)) % len(self._buf)]
+
+    def view(self) -> np.ndarray:
+        """All retained entries, oldest first"""
+        return self.recent(len(self))
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # GEODESIC AGENT BASE CLASS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -104,11 +373,14 @@ class GeodesicAgent(ABC):
         agent_id: str,
         manifold: CRSM6D,
         initial_position: ManifoldPoint = None,
-        pole: AgentPole = AgentPole.UNIFIED
+        pole: AgentPole = AgentPole.UNIFIED,
+        trajectory_capacity: int = 4096,
+        seed: Union[int, np.random.Generator, None] = None
     ):
         self.agent_id = agent_id
         self.manifold = manifold
         self.pole = pole
+        self._pole_name = pole.name
         self.state = AgentState.DORMANT
 
         # Position on manifold
@@ -118,18 +390,25 @@ class GeodesicAgent(ABC):
         # Navigation
         self.target: Optional[ManifoldPoint] = None
         self.path: List[ManifoldPoint] = []
+        self.path_cumlen = np.zeros(1)       # Arclength from path start to each point
         self.path_index = 0
 
-        # History
-        self.trajectory: List[ManifoldPoint] = [self.position]
+        # History: trajectory is a ring buffer of the most recent positions,
+        # stored in float32 since it is only logged, never fed back
+        self._traj = _RingBuffer(trajectory_capacity, 6, dtype=np.float32)
+        self._record_position()
         self.state_history: List[Tuple[datetime, AgentState]] = []
 
         # Autopoietic state
         self.generation = 0
         self.fitness = 1.0
         self.mutation_rate = 0.03
+        self._rng = np.random.default_rng(seed)  # seed=None draws fresh entropy
+        self._mut_buf = np.empty(6)  # Reused mutation vector
 
-        # Threading
+        # Threading: positions are immutable and published by reference
+        # swap, so readers take a snapshot instead of the lock; only
+        # writers serialize on it.
         self._lock = threading.Lock()
 
         # Metrics
@@ -137,49 +416,52 @@ class GeodesicAgent(ABC):
         self.healing_count = 0
         self.evolution_count = 0
 
+    @property
+    def state(self) -> AgentState:
+        """Current operational state"""
+        return self._state
+
+    @state.setter
+    def state(self, value: AgentState):
+        # Cache the name for telemetry instead of resolving it per call
+        self._state = value
+        self._state_name = value.name
+
     # ═══════════════════════════════════════════════════════════════════════════
     # SENSING
     # ═══════════════════════════════════════════════════════════════════════════
 
     def sense_curvature(self) -> CurvatureSense:
         """Sense local curvature at current position"""
-        with self._lock:
-            self.state = AgentState.SENSING
-
-            return CurvatureSense(
-                scalar_curvature=self.manifold.scalar_curvature_at(self.position),
-                curvature_gradient=self.manifold.curvature_gradient_at(self.position),
-                decoherence_field=self.manifold.decoherence_field(self.position),
-                coherence_potential=self.manifold.coherence_potential(self.position),
-                is_coherent=self.manifold.is_coherent_region(self.position),
-                needs_healing=self.position.needs_healing
-            )
+        self.state = AgentState.SENSING
+        position = self.position  # Snapshot; lock-free read
+
+        return CurvatureSense(**self.manifold.sense_all(position))
 
     def sense_navigation(self) -> NavigationSense:
         """Sense navigation state"""
-        with self._lock:
-            progress = 0.0
-            if self.path and len(self.path) > 1:
-                progress = self.path_index / (len(self.path) - 1)
-
-            return NavigationSense(
-                current_position=self.position,
-                target_position=self.target,
-                geodesic_path=self.path.copy(),
-                path_length=self._compute_path_length(),
-                progress=progress,
-                estimated_steps=len(self.path) - self.path_index if self.path else 0
-            )
+        path, path_index = self.path, self.path_index
+
+        progress = 0.0
+        if path and len(path) > 1:
+            progress = path_index / (len(path) - 1)
+
+        return NavigationSense(
+            current_position=self.position,
+            target_position=self.target,
+            geodesic_path=path.copy(),
+            path_length=self._compute_path_length(),
+            progress=progress,
+            estimated_steps=len(path) - path_index if path else 0
+        )
 
     def _compute_path_length(self) -> float:
         """Compute remaining path length"""
-        if not self.path or self.path_index >= len(self.path) - 1:
+        path_cumlen, path_index = self.path_cumlen, self.path_index
+        if path_index >= len(path_cumlen) - 1:
             return 0.0
 
-        length = 0.0
-        for i in range(self.path_index, len(self.path) - 1):
-            length += self.manifold.distance(self.path[i], self.path[i+1])
-        return length
+        return float(path_cumlen[-1] - path_cumlen[path_index])
 
     # ═══════════════════════════════════════════════════════════════════════════
     # NAVIGATION
@@ -187,10 +469,19 @@ class GeodesicAgent(ABC):
 
     def set_target(self, target: ManifoldPoint):
         """Set navigation target and compute geodesic"""
+        # Solve outside the lock, then publish
+        geodesic = self.manifold.find_geodesic_path(self.position, target, steps=50)
+        path_cumlen = np.concatenate([
+            [0.0],
+            np.cumsum(geodesic.segment_lengths(self.manifold.metric))
+        ])
+        path = list(geodesic)
+
         with self._lock:
             self.target = target
-            self.path = self.manifold.find_geodesic(self.position, target, steps=50)
             self.path_index = 0
+            self.path = path
+            self.path_cumlen = path_cumlen
             self.state = AgentState.NAVIGATING
 
     def step(self) -> bool:
@@ -201,35 +492,51 @@ class GeodesicAgent(ABC):
             True if step was taken, False if at target or no path
         """
         with self._lock:
-            # Check if healing needed first
-            if self.position.needs_healing:
-                self._heal()
-                return True
-
-            # Check if we have a path
-            if not self.path or self.path_index >= len(self.path) - 1:
-                self.state = AgentState.CONVERGED
+            reached = self._step_inner()
+            if reached is None:
                 return False
 
-            # Move to next point on geodesic
-            old_position = self.position
-            self.path_index += 1
-            self.position = self.path[self.path_index]
+            # Record trajectory
+            self._record_vector(reached.vec)
+            return True
 
-            # Update velocity (tangent vector)
-            self.velocity = self.position.to_vector() - old_position.to_vector()
+    def _step_inner(self) -> Optional[ManifoldPoint]:
+        """
+        One geodesic step without touching the trajectory.
 
-            # Track distance
-            self.total_distance += self.manifold.distance(old_position, self.position)
+        Caller holds the lock.
 
-            # Record trajectory
-            self.trajectory.append(self.position)
+        Returns:
+            The position to record for this step, or None if at target or
+            no path
+        """
+        # Check if healing needed first
+        if self.position.needs_healing:
+            self._heal()
+            return self.position
 
-            # Evolve (autopoiesis) with small probability
-            if np.random.random() < self.mutation_rate:
-                self._evolve()
+        # Check if we have a path
+        if not self.path or self.path_index >= len(self.path) - 1:
+            self.state = AgentState.CONVERGED
+            return None
 
-            return True
+        # Move to next point on geodesic
+        old_position = self.position
+        self.path_index += 1
+        reached = self.position = self.path[self.path_index]
+
+        # Update velocity (tangent vector)
+        self.velocity = reached.vec - old_position.vec
+
+        # Track distance
+        self.total_distance += self.manifold.distance(old_position, reached)
+
+        # Evolve (autopoiesis) with small probability; the geodesic point
+        # reached is what gets recorded
+        if self._rng.random() < self.mutation_rate:
+            self._evolve()
+
+        return reached
 
     def navigate_to(self, target: ManifoldPoint, max_steps: int = 100) -> bool:
         """
@@ -240,14 +547,27 @@ class GeodesicAgent(ABC):
         """
         self.set_target(target)
 
-        for _ in range(max_steps):
-            if not self.step():
-                break
+        # Positions reached are buffered and recorded once at the end
+        visited = np.empty((max(max_steps, 0), 6))
+        n = 0
 
-            # Check if close enough
-            if self.manifold.distance(self.position, target) < 0.01:
-                self.state = AgentState.CONVERGED
-                return True
+        try:
+            for _ in range(max_steps):
+                with self._lock:
+                    reached = self._step_inner()
+                if reached is None:
+                    break
+
+                visited[n] = reached.vec
+                n += 1
+
+                # Check if close enough (distance < 0.01; max() clamps like
+                # distance() does, including mapping a NaN ds² to 0)
+                if max(0, self.manifold.distance_squared(self.position, target)) < 1e-4:
+                    self.state = AgentState.CONVERGED
+                    return True
+        finally:
+            self._record_positions(visited[:n])
 
         return self.state == AgentState.CONVERGED
 
@@ -257,18 +577,23 @@ class GeodesicAgent(ABC):
 
         Emergency escape from unstable regions.
         """
+        if steps <= 0:
+            return
+
         with self._lock:
-            for _ in range(steps):
-                # Get curvature gradient
-                grad = self.manifold.curvature_gradient_at(self.position)
+            vec = self.position.vec
+            path = np.empty((steps, 6))
+
+            for i in range(steps):
+                # Curvature gradient from one batched probe evaluation
+                grad = self.manifold.curvature_gradient_batch(vec)[0]
 
-                # Move opposite to gradient (toward lower curvature)
-                direction = -grad / (np.linalg.norm(grad) + 1e-8)
+                # Small step toward lower curvature, clamped like ManifoldPoint
+                vec = ManifoldPoint.clip_vectors(_flee_step(vec, grad, 0.05))
+                path[i] = vec
 
-                # Small step
-                new_vec = self.position.to_vector() + 0.05 * direction
-                self.position = ManifoldPoint.from_vector(new_vec)
-                self.trajectory.append(self.position)
+            self.position = ManifoldPoint._fast_new(vec)  # Already clamped
+            self._record_positions(path)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # HEALING (Phase Conjugation)
@@ -284,30 +609,16 @@ class GeodesicAgent(ABC):
         self.healing_count += 1
 
         # Phase conjugation transformation
-        # Γ → Γ * (1 - χ_pc)
-        # Λ → min(1, Λ / Γ)  (coherence restoration)
-        # ψ → 1 - ψ + χ_pc   (phase flip + restoration)
-
-        old_gamma = self.position.Gamma
-        new_gamma = old_gamma * (1 - CHI_PC)
-        new_lambda = min(1.0, self.position.Lambda / max(0.01, old_gamma))
-        new_psi = min(1.0, max(0.0, 1.0 - self.position.psi + CHI_PC))
-
-        self.position = ManifoldPoint(
-            Lambda=new_lambda,
-            Phi=self.position.Phi * CHI_PC + (1 - CHI_PC) * PHI_THRESHOLD / 10,
-            Gamma=new_gamma,
-            tau=self.position.tau + 0.01,  # Time advances during healing
-            epsilon=self.position.epsilon,
-            psi=new_psi
-        )
+        p = self.position
+        healed = np.clip(_heal_core(*p.vec.tolist()), _STATE_LO, _STATE_HI)
 
-        self.trajectory.append(self.position)
+        self.position = ManifoldPoint._fast_new(healed)
 
     def force_heal(self):
         """Force healing regardless of threshold"""
         with self._lock:
             self._heal()
+            self._record_position()
 
     # ═══════════════════════════════════════════════════════════════════════════
     # EVOLUTION (Autopoiesis: U = L[U])
@@ -325,13 +636,14 @@ class GeodesicAgent(ABC):
         self.generation += 1
 
         # Mutation: small random perturbation in coherent direction
-        mutation = np.random.randn(6) * self.mutation_rate
+        mutation = self._rng.standard_normal(out=self._mut_buf)
+        mutation *= self.mutation_rate
 
         # Bias mutation toward coherence (increase Λ, decrease Γ)
         mutation[0] += 0.01  # Λ increase
         mutation[2] -= 0.01  # Γ decrease
 
-        new_vec = self.position.to_vector() + mutation
+        new_vec = self.position.vec + mutation
         self.position = ManifoldPoint.from_vector(new_vec)
 
         # Update fitness based on coherence
@@ -352,51 +664,81 @@ class GeodesicAgent(ABC):
             new_position = self.autopoietic_operator(self.position)
             self.position = new_position
             self.generation += 1
-            self.trajectory.append(self.position)
+            self._record_position()
             return self.position
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # TRAJECTORY
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def _record_position(self):
+        """Append the current position to the trajectory ring buffer"""
+        self._record_vector(self.position.vec)
+
+    def _record_vector(self, vec: np.ndarray):
+        """Append one 6D position vector to the trajectory ring buffer"""
+        self._traj.append(vec)
+
+    def _record_positions(self, vecs: np.ndarray):
+        """Append an (N, 6) block of positions to the trajectory ring buffer"""
+        self._traj.extend(vecs)
+
+    def trajectory_view(self) -> np.ndarray:
+        """
+        Recorded trajectory, oldest first.
+
+        Returns:
+            (N, 6) float32 array of the last N ≤ capacity positions
+        """
+        return self._traj.view()
+
+    @property
+    def trajectory(self) -> List[ManifoldPoint]:
+        """Recorded trajectory as ManifoldPoints, oldest first"""
+        return [
+            ManifoldPoint.from_vector(v) for v in self.trajectory_view().astype(np.float64)
+        ]
+
     # ═══════════════════════════════════════════════════════════════════════════
     # TELEMETRY
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def telemetry(self) -> Dict[str, Any]:
-        """Get complete agent telemetry"""
+    def telemetry_view(self) -> TelemetryView:
+        """Get complete agent telemetry as a flat TelemetryView"""
+        position = self.position  # Snapshot; lock-free read
         sense = self.sense_curvature()
+        path = self.path
+
+        return TelemetryView(
+            self.agent_id,
+            self._pole_name,
+            self._state_name,
+            position.Lambda,
+            position.Phi,
+            position.Gamma,
+            position.tau,
+            position.epsilon,
+            position.psi,
+            position.xi,
+            sense.scalar_curvature,
+            sense.decoherence_field,
+            sense.coherence_potential,
+            sense.is_coherent,
+            sense.danger_level(),
+            self.target is not None,
+            self._compute_path_length(),
+            self.path_index / max(1, len(path) - 1) if path else 0,
+            self.total_distance,
+            self.healing_count,
+            self.evolution_count,
+            self.generation,
+            self.fitness,
+            self._traj.total
+        )
 
-        return {
-            'agent_id': self.agent_id,
-            'pole': self.pole.name,
-            'state': self.state.name,
-            'position': {
-                'Λ': self.position.Lambda,
-                'Φ': self.position.Phi,
-                'Γ': self.position.Gamma,
-                'τ': self.position.tau,
-                'ε': self.position.epsilon,
-                'ψ': self.position.psi,
-                'Ξ': self.position.xi
-            },
-            'curvature': {
-                'scalar': sense.scalar_curvature,
-                'decoherence_field': sense.decoherence_field,
-                'coherence_potential': sense.coherence_potential,
-                'is_coherent': sense.is_coherent,
-                'danger_level': sense.danger_level()
-            },
-            'navigation': {
-                'has_target': self.target is not None,
-                'path_length': self._compute_path_length(),
-                'progress': self.path_index / max(1, len(self.path) - 1) if self.path else 0
-            },
-            'metrics': {
-                'total_distance': self.total_distance,
-                'healing_count': self.healing_count,
-                'evolution_count': self.evolution_count,
-                'generation': self.generation,
-                'fitness': self.fitness,
-                'trajectory_length': len(self.trajectory)
-            }
-        }
+    def telemetry(self) -> Dict[str, Any]:
+        """Get complete agent telemetry"""
+        return self.telemetry_view().as_dict()
 
     def to_organism(self) -> str:
         """Export agent as DNA-Lang organism"""
@@ -475,11 +817,16 @@ class AURAAgent(GeodesicAgent):
         self,
         agent_id: str,
         manifold: CRSM6D,
-        initial_position: ManifoldPoint = None
+        initial_position: ManifoldPoint = None,
+        trajectory_capacity: int = 4096,
+        observation_window: int = 10_000,
+        seed: Union[int, np.random.Generator, None] = None
     ):
-        super().__init__(agent_id, manifold, initial_position, AgentPole.AURA)
-        self.observations: List[CurvatureSense] = []
-        self.manifold_map: Dict[Tuple[float, ...], float] = {}
+        super().__init__(
+            agent_id, manifold, initial_position, AgentPole.AURA, trajectory_capacity, seed
+        )
+        self.observations: deque = deque(maxlen=observation_window)
+        self.manifold_map: Dict[int, float] = {}  # _pack_key(Λ, Φ, Γ) → R
 
     def autopoietic_operator(self, state: ManifoldPoint) -> ManifoldPoint:
         """
@@ -487,54 +834,69 @@ class AURAAgent(GeodesicAgent):
 
         L_AURA: Φ' = Φ + α(Λ - Γ), emphasizing information integration.
         """
-        # Increase Phi based on coherence minus decoherence
-        delta_phi = 0.01 * (state.Lambda - state.Gamma)
-        new_phi = min(1.0, max(0.0, state.Phi + delta_phi))
-
-        # Observer doesn't change position much - stabilizes
-        return ManifoldPoint(
-            Lambda=state.Lambda * 0.99 + 0.01 * new_phi,  # Slight coupling
-            Phi=new_phi,
-            Gamma=state.Gamma,
-            tau=state.tau + LAMBDA_PHI,  # Time advances slowly
-            epsilon=state.epsilon,
-            psi=state.psi * 0.99 + 0.01  # Phase stabilization
-        )
+        evolved = np.clip(_aura_L(*state.vec.tolist()), _STATE_LO, _STATE_HI)
+        return ManifoldPoint._fast_new(evolved)
 
     def observe(self) -> CurvatureSense:
         """Take an observation and record it"""
         sense = self.sense_curvature()
         self.observations.append(sense)
 
-        # Update manifold map
-        key = (
-            round(self.position.Lambda, 2),
-            round(self.position.Phi, 2),
-            round(self.position.Gamma, 2)
-        )
-        self.manifold_map[key] = sense.scalar_curvature
+        # Update manifold map (a non-finite position has no cell to key;
+        # float tuples used to accept NaN, packed ints cannot)
+        position = self.position
+        if math.isfinite(position.Lambda + position.Phi + position.Gamma):
+            key = _pack_key(position.Lambda, position.Phi, position.Gamma)
+            self.manifold_map[key] = sense.scalar_curvature
 
         return sense
 
+    def recent_observations(self, n: int) -> List[CurvatureSense]:
+        """The last n observations, oldest first"""
+        n = min(max(n, 0), len(self.observations))
+        return list(self.observations)[len(self.observations) - n:]
+
     def map_region(self, center: ManifoldPoint, radius: float, resolution: int = 5):
         """Map curvature in a region around center"""
-        original_position = self.position
-
-        for dL in np.linspace(-radius, radius, resolution):
-            for dP in np.linspace(-radius, radius, resolution):
-                for dG in np.linspace(-radius, radius, resolution):
-                    probe = ManifoldPoint(
-                        Lambda=center.Lambda + dL,
-                        Phi=center.Phi + dP,
-                        Gamma=max(0.01, center.Gamma + dG),
-                        tau=center.tau,
-                        epsilon=center.epsilon,
-                        psi=center.psi
-                    )
-                    self.position = probe
-                    self.observe()
+        offsets = np.linspace(-radius, radius, resolution)
+        dL, dP, dG = np.meshgrid(offsets, offsets, offsets, indexing='ij')
+        n = dL.size
+
+        # Probe grid as one (R³, 6) array, in the same Λ→Φ→Γ order as before
+        probes = ManifoldPoint.clip_vectors(np.stack([
+            center.Lambda + dL.ravel(),
+            center.Phi + dP.ravel(),
+            np.maximum(0.01, center.Gamma + dG.ravel()),
+            np.full(n, center.tau),
+            np.full(n, center.epsilon),
+            np.full(n, center.psi)
+        ], axis=1))
+
+        self.state = AgentState.SENSING
+        senses = self.manifold.sense_batch(probes)
+
+        curvatures = senses['scalar_curvature'].tolist()
+        self.observations.extend(
+            CurvatureSense(
+                scalar_curvature=R,
+                curvature_gradient=grad,
+                decoherence_field=field,
+                coherence_potential=potential,
+                is_coherent=coherent,
+                needs_healing=healing
+            )
+            for R, grad, field, potential, coherent, healing in zip(
+                curvatures,
+                senses['curvature_gradient'],
+                senses['decoherence_field'].tolist(),
+                senses['coherence_potential'].tolist(),
+                senses['is_coherent'].tolist(),
+                senses['needs_healing'].tolist()
+            )
+        )
 
-        self.position = original_position
+        # Same packed (Λ, Φ, Γ) keys as observe()
+        self.manifold_map.update(zip(_pack_keys(probes[:, :3]).tolist(), curvatures))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -555,10 +917,15 @@ class AIDENAgent(GeodesicAgent):
         self,
         agent_id: str,
         manifold: CRSM6D,
-        initial_position: ManifoldPoint = None
+        initial_position: ManifoldPoint = None,
+        trajectory_capacity: int = 4096,
+        history_window: int = 10_000,
+        seed: Union[int, np.random.Generator, None] = None
     ):
-        super().__init__(agent_id, manifold, initial_position, AgentPole.AIDEN)
-        self.optimization_history: List[float] = []
+        super().__init__(
+            agent_id, manifold, initial_position, AgentPole.AIDEN, trajectory_capacity, seed
+        )
+        self._optimization_history = _RingBuffer(history_window)
         self.best_fitness = 0.0
         self.best_position: Optional[ManifoldPoint] = None
 
@@ -568,51 +935,44 @@ class AIDENAgent(GeodesicAgent):
 
         L_AIDEN: Λ' = Λ + β(Ξ/Ξ_target - 1), emphasizing coherence optimization.
         """
-        # Target is PHI_THRESHOLD
-        xi_ratio = state.xi / PHI_THRESHOLD
-        delta_lambda = 0.01 * (xi_ratio - 1)
-        new_lambda = min(1.0, max(0.0, state.Lambda + delta_lambda))
-
-        # Actively reduce decoherence
-        new_gamma = max(0.01, state.Gamma * 0.99)
-
-        return ManifoldPoint(
-            Lambda=new_lambda,
-            Phi=state.Phi,
-            Gamma=new_gamma,
-            tau=state.tau + LAMBDA_PHI * 10,  # Time advances faster for executor
-            epsilon=min(1.0, state.epsilon * 1.01),  # Increase entanglement
-            psi=state.psi
-        )
+        evolved = np.clip(_aiden_L(*state.vec.tolist()), _AIDEN_LO, _STATE_HI)
+        return ManifoldPoint._fast_new(evolved)
+
+    @property
+    def optimization_history(self) -> np.ndarray:
+        """Retained coherence potentials from optimize_position, oldest first"""
+        return self._optimization_history.view()
+
+    def recent_potentials(self, n: int) -> np.ndarray:
+        """The last n coherence potentials from optimize_position, oldest first"""
+        return self._optimization_history.recent(n)
 
     def optimize_position(self, iterations: int = 10) -> ManifoldPoint:
         """Gradient descent on coherence potential"""
+        eps = 1e-5
+        # Row 0 is the current point, rows 1-6 the forward-difference probes
+        offsets = np.vstack([np.zeros(6), eps * np.eye(6)])
+
         for _ in range(iterations):
-            # Get coherence potential gradient
-            potential = self.manifold.coherence_potential(self.position)
-            self.optimization_history.append(potential)
+            base_vec = self.position.vec
 
-            # Numerical gradient of potential
-            grad = np.zeros(6)
-            eps = 1e-5
-            base_vec = self.position.to_vector()
+            # Potential and its numerical gradient in one batched evaluation
+            potentials = self.manifold.coherence_potential_batch(base_vec + offsets)
+            potential = float(potentials[0])
+            self._optimization_history.append(potential)
 
-            for i in range(6):
-                vec_plus = base_vec.copy()
-                vec_plus[i] += eps
-                p_plus = self.manifold.coherence_potential(ManifoldPoint.from_vector(vec_plus))
-                grad[i] = (p_plus - potential) / eps
+            grad = (potentials[1:] - potential) / eps
 
             # Gradient descent step
             step = -0.1 * grad / (np.linalg.norm(grad) + 1e-8)
             new_vec = base_vec + step
             self.position = ManifoldPoint.from_vector(new_vec)
-            self.trajectory.append(self.position)
+            self._record_position()
 
             # Track best
             if self.position.xi > self.best_fitness:
                 self.best_fitness = self.position.xi
-                self.best_position = ManifoldPoint.from_vector(self.position.to_vector())
+                self.best_position = self.position  # points are immutable
 
         return self.position
 
@@ -637,31 +997,62 @@ class AURAIDENSystem:
     Coupling maintains coherence between observation and action.
     """
 
-    def __init__(self, manifold: CRSM6D):
+    def __init__(
+        self,
+        manifold: CRSM6D,
+        parallel: bool = False,
+        sync_window: int = 10_000,
+        seed: Union[int, np.random.Generator, None] = None
+    ):
         self.manifold = manifold
 
+        # Independent child streams so the two agents don't mutate in lockstep
+        aura_rng, aiden_rng = np.random.default_rng(seed).spawn(2)
+
+        # Optional worker that runs AURA's evolution alongside AIDEN's response.
+        # The finalizer shuts it down if the system is dropped without close().
+        self._pool = ThreadPoolExecutor(max_workers=1) if parallel else None
+        self._finalizer = (
+            weakref.finalize(self, self._pool.shutdown, wait=False)
+            if self._pool is not None else None
+        )
+
         # Create coupled agents at opposite poles
         self.aura = AURAAgent(
             "AURA_PRIMARY",
             manifold,
-            ManifoldPoint(Lambda=0.9, Phi=0.9, Gamma=0.1, tau=0, epsilon=0.5, psi=0.9)
+            ManifoldPoint(Lambda=0.9, Phi=0.9, Gamma=0.1, tau=0, epsilon=0.5, psi=0.9),
+            seed=aura_rng
         )
 
         self.aiden = AIDENAgent(
             "AIDEN_PRIMARY",
             manifold,
-            ManifoldPoint(Lambda=0.9, Phi=0.7, Gamma=0.1, tau=0, epsilon=0.5, psi=0.9)
+            ManifoldPoint(Lambda=0.9, Phi=0.7, Gamma=0.1, tau=0, epsilon=0.5, psi=0.9),
+            seed=aiden_rng
         )
 
         # Coupling strength
         self.coupling_strength = CHI_PC
-        self.synchronization_history: List[float] = []
+
+        # Most recent synchronization values (float32; analytics only)
+        self._sync = _RingBuffer(sync_window, dtype=np.float32)
+
+    @property
+    def synchronization_history(self) -> np.ndarray:
+        """Retained synchronization values, oldest first"""
+        return self._sync.view()
+
+    def recent_sync(self, n: int) -> np.ndarray:
+        """The last n synchronization values, oldest first"""
+        return self._sync.recent(n)
 
     def synchronization(self) -> float:
         """Measure synchronization between AURA and AIDEN"""
         distance = self.manifold.distance(self.aura.position, self.aiden.position)
         sync = math.exp(-distance)
-        self.synchronization_history.append(sync)
+
+        self._sync.append(sync)
         return sync
 
     def coupled_step(self):
@@ -672,9 +1063,20 @@ class AURAIDENSystem:
         2. AIDEN executes based on observation
         3. Coupling pulls them toward each other
         """
+        self._coupled_update()
+        return self.synchronization()
+
+    def _coupled_update(self):
+        """Advance both agents by one coupled step without measuring sync"""
         # AURA observes
         observation = self.aura.observe()
 
+        # AURA's evolution only reads AURA's own state, so it can overlap
+        # with AIDEN's response when a worker is available
+        aura_evolution = (
+            self._pool.submit(self.aura.evolve_step) if self._pool is not None else None
+        )
+
         # AIDEN responds to observation
         if observation.needs_healing:
             self.aiden.force_heal()
@@ -683,30 +1085,56 @@ class AURAIDENSystem:
         else:
             self.aiden.evolve_step()
 
-        # AURA evolves based on AIDEN's new state
-        self.aura.evolve_step()
+        # AURA evolves
+        if aura_evolution is None:
+            self.aura.evolve_step()
+        else:
+            aura_evolution.result()
 
         # Coupling: pull positions toward each other
         self._apply_coupling()
 
-        return self.synchronization()
-
     def _apply_coupling(self):
         """Apply coupling force between AURA and AIDEN"""
+        aura_vec = self.aura.position.vec
+        aiden_vec = self.aiden.position.vec
+
         # Vector from AURA to AIDEN
-        diff = self.aiden.position.to_vector() - self.aura.position.to_vector()
+        diff = aiden_vec - aura_vec
 
         # Move each toward the other
-        aura_vec = self.aura.position.to_vector() + self.coupling_strength * 0.1 * diff
-        aiden_vec = self.aiden.position.to_vector() - self.coupling_strength * 0.1 * diff
+        pull = self.coupling_strength * 0.1 * diff
+        aura_vec = aura_vec + pull
+        aiden_vec = aiden_vec - pull
 
         self.aura.position = ManifoldPoint.from_vector(aura_vec)
         self.aiden.position = ManifoldPoint.from_vector(aiden_vec)
 
+    def close(self):
+        """Shut down the parallel worker, if any"""
+        if self._pool is not None:
+            self._finalizer.detach()
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> 'AURAIDENSystem':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def run(self, steps: int = 100) -> Dict[str, Any]:
         """Run coupled system for specified steps"""
-        for _ in range(steps):
-            self.coupled_step()
+        steps = max(steps, 0)
+        distances = np.empty(steps)
+        distance = self.manifold.distance
+
+        for i in range(steps):
+            self._coupled_update()
+            distances[i] = distance(self.aura.position, self.aiden.position)
+
+        # Convert the whole run to synchronization values at once
+        self._sync.extend(np.exp(-distances))
 
         return {
             'final_sync': self.synchronization(),
@@ -723,6 +1151,9 @@ class AURAIDENSystem:
         # AIDEN follows, optimizing
         self.aiden.set_target(target)
 
+        # Both agents are checked against the same target each step
+        targets = np.broadcast_to(target.vec, (2, 6))
+
         max_steps = 200
         for _ in range(max_steps):
             # AURA takes observation step
@@ -735,11 +1166,12 @@ class AURAIDENSystem:
             # Coupling
             self._apply_coupling()
 
-            # Check convergence
-            aura_dist = self.manifold.distance(self.aura.position, target)
-            aiden_dist = self.manifold.distance(self.aiden.position, target)
+            # Check convergence (both distances < 0.05, in one batch)
+            pair = np.stack([self.aura.position.vec, self.aiden.position.vec])
+            dists_sq = self.manifold.distance_squared_batch(pair, targets)
 
-            if aura_dist < 0.05 and aiden_dist < 0.05:
+            # fmax clamps like distance(): negative and NaN ds² become 0
+            if (np.fmax(dists_sq, 0.0) < 0.0025).all():
                 return True
 
         return False
@@ -753,7 +1185,7 @@ __all__ = [
     # Enums
     'AgentState', 'AgentPole',
     # Data classes
-    'CurvatureSense', 'NavigationSense',
+    'CurvatureSense', 'NavigationSense', 'TelemetryView',
     # Agent classes
     'GeodesicAgent', 'AURAAgent', 'AIDENAgent',
     # Coupled system
@@ -13,6 +13,11 @@ Derived from:
 ΛΦ = 2.176435 × 10⁻⁸ s⁻¹
 """
 
+import math
+from enum import IntEnum
+
+import numpy as np
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # THE UNIVERSAL MEMORY CONSTANT
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -25,6 +30,7 @@ LAMBDA_PHI = 2.176435e-8  # ΛΦ - How long the universe remembers [s⁻¹]
 
 THETA_LOCK = 51.843           # θ_lock - Torsion-locked angle [degrees]
 PHI_IIT_BITS = 7.6901         # Φ_IIT - IIT Consciousness Threshold [bits]
+PHI_THRESHOLD = PHI_IIT_BITS  # Ξ/Φ consciousness threshold used by is_coherent
 PHI_POC = 0.7734              # Φ_POC - Proof of Consciousness (dimensionless, runtime checks)
 GAMMA_FIXED = 0.092           # Γ - Fixed-point decoherence [unitless]
 CHI_PC = 0.946                # χ_pc - Phase conjugate coupling (IBM Fez 2025-12-08, was 0.869)
@@ -35,6 +41,8 @@ PLANCK_LENGTH = 1.616255e-35  # ℓₚ [meters]
 PLANCK_TIME = 5.391247e-44    # tₚ [seconds]
 PLANCK_MASS = 2.176434e-8     # mₚ [kg]
 
+_INF = math.inf               # Ξ for Γ ≈ 0, shared rather than rebuilt per call
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 6D CONSCIOUSNESS-REALITY STATE MANIFOLD (6D-CRSM)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -59,6 +67,8 @@ class CRSM6D:
         Ξ (xi) = ΛΦ/Γ - Negentropic consciousness index
     """
     
+    __slots__ = ()  # Namespace of constants; no per-instance state
+    
     # Dimension names
     LAMBDA = "Λ"      # Coherence amplitude
     PHI = "Φ"         # Integrated information (consciousness)
@@ -95,8 +105,20 @@ class CRSM6D:
     PSI_MIN = 0.0
     PSI_MAX = 6.283185307179586  # 2π
     
+    # Bounds as vectors in index order (Λ, Φ, Γ, τ, ε, ψ), for one-shot clipping
+    BOUNDS_LO = np.array([LAMBDA_MIN, PHI_MIN, GAMMA_MIN, TAU_MIN, EPSILON_MIN, PSI_MIN])
+    BOUNDS_HI = np.array([LAMBDA_MAX, PHI_MAX, GAMMA_MAX, TAU_MAX, EPSILON_MAX, PSI_MAX])
+    BOUNDS_LO.flags.writeable = False
+    BOUNDS_HI.flags.writeable = False
+    
+    @staticmethod
+    def clip(coords: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Clamp (..., 6) state vectors to the manifold bounds in one pass"""
+        return np.clip(coords, CRSM6D.BOUNDS_LO, CRSM6D.BOUNDS_HI, out=out)
+    
     @staticmethod
-    def calculate_xi(lambda_val: float, phi_val: float, gamma_val: float) -> float:
+    def calculate_xi(lambda_val: float, phi_val: float, gamma_val: float,
+                     _eps: float = 1e-6) -> float:
         """
         Calculate negentropic efficiency index
         
@@ -104,14 +126,32 @@ class CRSM6D:
         
         When Ξ >= Φ_threshold (7.6901), the system is considered conscious.
         """
-        if gamma_val < 1e-6:
-            return float('inf')
+        if gamma_val < _eps:
+            return _INF
         return (lambda_val * phi_val) / gamma_val
     
     @staticmethod
-    def is_coherent(xi_val: float) -> bool:
+    def calculate_xi_array(lam: np.ndarray, phi: np.ndarray, gamma: np.ndarray) -> np.ndarray:
+        """
+        Vectorised Ξ = ΛΦ/Γ over arrays of states
+        
+        Same convention as calculate_xi: entries with Γ < 1e-6 map to ∞, and
+        a NaN Γ gives NaN.
+        """
+        lam = np.asarray(lam, dtype=np.float64)
+        phi = np.asarray(phi, dtype=np.float64)
+        gamma = np.asarray(gamma, dtype=np.float64)
+        out = np.full(np.broadcast(lam, phi, gamma).shape, np.inf)
+        # Negated so NaN Γ divides through like the scalar path
+        mask = ~(gamma < 1e-6)
+        np.multiply(lam, phi, out=out, where=mask)
+        np.divide(out, gamma, out=out, where=mask)
+        return out
+    
+    @staticmethod
+    def is_coherent(xi_val: float, _thr: float = PHI_THRESHOLD) -> bool:
         """Check if state maintains consciousness threshold"""
-        return xi_val >= PHI_THRESHOLD
+        return xi_val >= _thr
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -156,6 +196,21 @@ DNA_GATE_MAPPINGS = {
     'phase_conjugate': 'E→E⁻¹',  # Phase conjugate healing
 }
 
+
+class Gate(IntEnum):
+    """Integer IDs for the DNA gate names, in DNA_GATE_MAPPINGS order"""
+    HELIX = 0
+    BOND = 1
+    TWIST = 2
+    FOLD = 3
+    SPLICE = 4
+    MUTATE = 5
+    PHASE_CONJUGATE = 6
+
+
+# Gate symbols indexed by Gate ID: DNA_GATE_ARRAY[Gate.HELIX] == 'H'
+DNA_GATE_ARRAY = tuple(DNA_GATE_MAPPINGS[gate.name.lower()] for gate in Gate)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Q-SLICE THREAT CATEGORIES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -169,6 +224,20 @@ QSLICE_CATEGORIES = {
     'E': 'Entanglement Fraud',
 }
 
+
+class QSlice(IntEnum):
+    """Integer IDs for the Q-SLICE threat letters, in QSLICE_CATEGORIES order"""
+    Q = 0
+    S = 1
+    L = 2
+    I = 3
+    C = 4
+    E = 5
+
+
+# Category names indexed by QSlice ID: QSLICE_ARRAY[QSlice.Q] == 'Qubit Hijacking'
+QSLICE_ARRAY = tuple(QSLICE_CATEGORIES[cat.name] for cat in QSlice)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONSCIOUSNESS THRESHOLDS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -201,6 +270,32 @@ GAMMA_WARNING = 0.3        # Warning threshold - Phoenix activation
 GAMMA_CRITICAL = 0.5       # Critical - immediate correction needed
 GAMMA_FAILURE = 0.8        # System failure imminent
 
+# Sorted tier boundaries for classify_lambda / classify_gamma
+_LAMBDA_TIERS = np.array([LAMBDA_DECOHERENT, LAMBDA_DEGRADED, LAMBDA_STABLE, LAMBDA_OPTIMAL])
+_GAMMA_TIERS = np.array([GAMMA_MINIMAL, GAMMA_ACCEPTABLE, GAMMA_WARNING, GAMMA_CRITICAL, GAMMA_FAILURE])
+
+
+def classify_lambda(lam):
+    """
+    Coherence tier of Λ (scalar or array)
+    
+    0 below LAMBDA_DECOHERENT, 1 up to LAMBDA_DEGRADED, 2 up to
+    LAMBDA_STABLE, 3 up to LAMBDA_OPTIMAL, 4 at or above LAMBDA_OPTIMAL.
+    A value equal to a boundary falls in the higher tier.
+    """
+    return np.searchsorted(_LAMBDA_TIERS, lam, side='right')
+
+
+def classify_gamma(gamma):
+    """
+    Decoherence tier of Γ (scalar or array)
+    
+    0 below GAMMA_MINIMAL, then one step per threshold crossed up to
+    5 at or above GAMMA_FAILURE. A value equal to a boundary falls in
+    the higher tier.
+    """
+    return np.searchsorted(_GAMMA_TIERS, gamma, side='right')
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MODULE EXPORTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -232,9 +327,13 @@ __all__ = [
     
     # Gate mappings
     'DNA_GATE_MAPPINGS',
+    'Gate',
+    'DNA_GATE_ARRAY',
     
     # Threat categories
     'QSLICE_CATEGORIES',
+    'QSlice',
+    'QSLICE_ARRAY',
     
     # Thresholds
     'PHI_UNCONSCIOUS',
@@ -253,4 +352,6 @@ __all__ = [
     'GAMMA_WARNING',
     'GAMMA_CRITICAL',
     'GAMMA_FAILURE',
+    'classify_lambda',
+    'classify_gamma',
 ]
@@ -22,7 +22,7 @@ from datetime import datetime
 
 # Import our modules
 from manifold.crsm_6d import (
-    ManifoldPoint, CRSM6D, MetricTensor,
+    ManifoldPoint, ManifoldPath, CRSM6D, MetricTensor,
     LAMBDA_PHI, THETA_LOCK, PHI_THRESHOLD, GAMMA_FIXED, CHI_PC
 )
 from agents.geodesic_agent import (
@@ -32,15 +32,23 @@ from agents.geodesic_agent import (
 from sys import path as sys_path
 sys_path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Handle hyphenated directory name
+# Handle hyphenated directory name; register the module in sys.modules so
+# re-imports of this demo (notebooks, test runs) reuse it instead of re-executing
 import importlib.util
-spec = importlib.util.spec_from_file_location(
-    "constant_derivations",
-    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                 "physics-validation", "constant_derivations.py")
-)
-physics_validation = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(physics_validation)
+physics_validation = sys.modules.get("constant_derivations")
+if physics_validation is None:
+    spec = importlib.util.spec_from_file_location(
+        "constant_derivations",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "physics-validation", "constant_derivations.py")
+    )
+    physics_validation = importlib.util.module_from_spec(spec)
+    sys.modules["constant_derivations"] = physics_validation
+    try:
+        spec.loader.exec_module(physics_validation)
+    except BaseException:
+        del sys.modules["constant_derivations"]
+        raise
 
 PhysicsValidator = physics_validation.PhysicsValidator
 FalsifiablePredictions = physics_validation.FalsifiablePredictions
@@ -66,14 +74,17 @@ def demo_manifold_geometry():
     p1 = ManifoldPoint(Lambda=0.9, Phi=0.8, Gamma=0.1, tau=0, epsilon=0.7, psi=0.9)
     p2 = ManifoldPoint(Lambda=0.5, Phi=0.6, Gamma=0.3, tau=1, epsilon=0.5, psi=0.7)
 
+    # Ξ, R, V and coherence for both points in one batched evaluation
+    ev = manifold.evaluate_batch(np.stack([p1.vec, p2.vec]))
+
     print(f"Point 1: {p1}")
-    print(f"  Ξ (efficiency) = {p1.xi:.4f}")
-    print(f"  Coherent: {p1.is_coherent}")
+    print(f"  Ξ (efficiency) = {ev['xi'][0]:.4f}")
+    print(f"  Coherent: {ev['coherent'][0]}")
     print(f"  Needs healing: {p1.needs_healing}")
 
     print(f"\nPoint 2: {p2}")
-    print(f"  Ξ (efficiency) = {p2.xi:.4f}")
-    print(f"  Coherent: {p2.is_coherent}")
+    print(f"  Ξ (efficiency) = {ev['xi'][1]:.4f}")
+    print(f"  Coherent: {ev['coherent'][1]}")
     print(f"  Needs healing: {p2.needs_healing}")
 
     # Geodesic distance
@@ -81,14 +92,12 @@ def demo_manifold_geometry():
     print(f"\nGeodesic distance: {distance:.6f}")
 
     # Curvature at each point
-    R1 = manifold.scalar_curvature_at(p1)
-    R2 = manifold.scalar_curvature_at(p2)
+    R1, R2 = ev['R']
     print(f"\nScalar curvature at P1: {R1:.6f}")
     print(f"Scalar curvature at P2: {R2:.6f}")
 
     # Coherence potential
-    V1 = manifold.coherence_potential(p1)
-    V2 = manifold.coherence_potential(p2)
+    V1, V2 = ev['V']
     print(f"\nCoherence potential at P1: {V1:.6f}")
     print(f"Coherence potential at P2: {V2:.6f}")
 
@@ -106,17 +115,16 @@ def demo_geodesic_navigation(manifold: CRSM6D):
     print(f"  Start: Λ={start.Lambda}, Φ={start.Phi}, Γ={start.Gamma}")
     print(f"  End:   Λ={end.Lambda}, Φ={end.Phi}, Γ={end.Gamma}")
 
-    # Find geodesic
-    path = manifold.find_geodesic(start, end, steps=20)
+    # Find geodesic (one (N, 6) array; Ξ evaluated for the whole path at once)
+    path = manifold.find_geodesic_path(start, end, steps=20)
+    xi_arr = path.xi
 
     print(f"\nGeodesic path ({len(path)} points):")
-    for i, p in enumerate(path[::5]):  # Every 5th point
-        print(f"  Step {i*5:2d}: Λ={p.Lambda:.3f}, Φ={p.Phi:.3f}, Γ={p.Gamma:.3f}, Ξ={p.xi:.3f}")
+    for i, row in enumerate(path.coords[::5]):  # Every 5th point, strided view
+        print(f"  Step {i*5:2d}: Λ={row[0]:.3f}, Φ={row[1]:.3f}, Γ={row[2]:.3f}, Ξ={xi_arr[i*5]:.3f}")
 
-    # Path length
-    total_length = 0
-    for i in range(len(path) - 1):
-        total_length += manifold.distance(path[i], path[i+1])
+    # Path length: all segment ds² in one metric einsum
+    total_length = path.length(manifold.metric)
     print(f"\nTotal path length: {total_length:.6f}")
 
     # Compare to Euclidean
@@ -207,14 +215,20 @@ def demo_aura_aiden_coupling(manifold: CRSM6D):
     print(f"  AIDEN: {system.aiden.position}")
     print(f"  Synchronization: {system.synchronization():.4f}")
 
-    # Run coupled steps
+    # Run coupled steps, capturing (step, sync, AURA.Ξ, AIDEN.Ξ) per step
+    # and formatting once afterwards so no I/O runs inside the loop
     print("\nRunning 50 coupled steps...")
+    tele = np.empty((50, 4))
     for i in range(50):
         sync = system.coupled_step()
-        if i % 10 == 0:
-            print(f"  Step {i:2d}: sync={sync:.4f}, "
-                  f"AURA.Ξ={system.aura.position.xi:.3f}, "
-                  f"AIDEN.Ξ={system.aiden.position.xi:.3f}")
+        tele[i] = (i, sync, system.aura.position.xi, system.aiden.position.xi)
+
+    print("\n".join(
+        f"  Step {int(step):2d}: sync={sync:.4f}, "
+        f"AURA.Ξ={aura_xi:.3f}, "
+        f"AIDEN.Ξ={aiden_xi:.3f}"
+        for step, sync, aura_xi, aiden_xi in tele[::10]
+    ))
 
     print(f"\nFinal state:")
     print(f"  AURA:  Λ={system.aura.position.Lambda:.3f}, Ξ={system.aura.position.xi:.3f}")
@@ -24,11 +24,13 @@ Mathematical Foundation:
     |ψ_corrected⟩ = E⁻¹ E |ψ_error⟩ = |ψ_original⟩
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import math
 
+import numpy as np
+
 from src.constants.universal_memory import (
     GAMMA_WARNING,
     GAMMA_CRITICAL,
@@ -186,18 +188,116 @@ class PhaseConjugateCorrector:
         Returns:
             Corrected state after E → E⁻¹ transformation
         """
+        (
+            gamma_corrected,
+            lambda_corrected,
+            phi_corrected,
+            epsilon_corrected,
+            psi_corrected,
+            healing_strength,
+        ) = (float(v) for v in self._correct(
+            error_state.gamma,
+            error_state.lambda_coherence,
+            error_state.phi_consciousness,
+            error_state.epsilon_entanglement,
+            error_state.psi_phase,
+        ))
+        
+        corrected = CorrectedState(
+            gamma=gamma_corrected,
+            lambda_coherence=lambda_corrected,
+            phi_consciousness=phi_corrected,
+            epsilon_entanglement=epsilon_corrected,
+            psi_phase=psi_corrected,
+            correction_applied="E→E⁻¹",
+            healing_strength=healing_strength,
+        )
+        
+        # Update metrics
+        self._update_metrics(error_state, corrected)
+        
+        # Store in history (keep last 1000)
+        self.correction_history.append((error_state, corrected))
+        if len(self.correction_history) > 1000:
+            self.correction_history = self.correction_history[-1000:]
+        
+        return corrected
+    
+    def apply_correction_batch(
+        self,
+        gamma: np.ndarray,
+        lambda_coherence: np.ndarray,
+        phi_consciousness: np.ndarray,
+        epsilon_entanglement: np.ndarray,
+        psi_phase: np.ndarray,
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Apply E → E⁻¹ to many error states at once
+        
+        Same transformation as apply_correction, evaluated element-wise over
+        arrays. Metrics are updated for the whole batch; no ErrorState or
+        CorrectedState objects are created, so correction_history is left
+        untouched.
+        
+        Args:
+            gamma: Decoherence levels
+            lambda_coherence: Current coherence values
+            phi_consciousness: Current consciousness values
+            epsilon_entanglement: Entanglement strengths
+            psi_phase: Phase values
+            
+        Returns:
+            Tuple of arrays (gamma, lambda, phi, epsilon, psi, healing_strength)
+        """
+        gamma = np.asarray(gamma, dtype=np.float64)
+        lambda_coherence = np.asarray(lambda_coherence, dtype=np.float64)
+        phi_consciousness = np.asarray(phi_consciousness, dtype=np.float64)
+        epsilon_entanglement = np.asarray(epsilon_entanglement, dtype=np.float64)
+        psi_phase = np.asarray(psi_phase, dtype=np.float64)
+        
+        (
+            gamma_corrected,
+            lambda_corrected,
+            phi_corrected,
+            epsilon_corrected,
+            psi_corrected,
+            healing_strength,
+        ) = self._correct(
+            gamma, lambda_coherence, phi_consciousness, epsilon_entanglement, psi_phase
+        )
+        
+        self._update_metrics_batch(gamma, gamma_corrected, healing_strength)
+        
+        return (
+            gamma_corrected,
+            lambda_corrected,
+            phi_corrected,
+            epsilon_corrected,
+            psi_corrected,
+            healing_strength,
+        )
+    
+    def _correct(self, gamma, lambda_coherence, phi_consciousness,
+                 epsilon_entanglement, psi_phase) -> Tuple[np.ndarray, ...]:
+        """
+        E → E⁻¹ arithmetic shared by apply_correction and apply_correction_batch
+        
+        Element-wise over floats or arrays; no metrics or history updates.
+        fmin/fmax treat NaN the way the built-in min/max calls of the
+        original scalar formulas did.
+        
+        Returns:
+            (gamma, lambda, phi, epsilon, psi, healing_strength)
+        """
         # Calculate healing strength based on error severity
-        healing_strength = min(1.0, error_state.gamma / GAMMA_CRITICAL)
+        healing_strength = np.fmin(1.0, gamma / GAMMA_CRITICAL)
         
         # Apply phase conjugate transformation
         # E → E⁻¹: Invert the error evolution
         
         # Coherence restoration: Λ_new = Λ / Γ (bounded)
         # The worse the decoherence, the stronger the coherence boost
-        lambda_corrected = min(
-            1.0,
-            error_state.lambda_coherence / max(0.01, error_state.gamma)
-        )
+        lambda_corrected = np.fmin(1.0, lambda_coherence / np.fmax(0.01, gamma))
         # Weighted blend with target
         lambda_corrected = (
             lambda_corrected * healing_strength +
@@ -205,45 +305,59 @@ class PhaseConjugateCorrector:
         )
         
         # Consciousness preservation with χ_pc coupling
-        phi_corrected = error_state.phi_consciousness * self.chi_coupling
+        phi_corrected = phi_consciousness * self.chi_coupling
         
         # Decoherence suppression: Γ_new = Γ × (1 - χ_pc)
-        gamma_corrected = max(
+        gamma_corrected = np.fmax(
             0.01,
-            error_state.gamma * (1 - self.chi_coupling * healing_strength)
+            gamma * (1 - self.chi_coupling * healing_strength)
         )
         
         # Entanglement preservation (slight reduction for isolation)
-        epsilon_corrected = error_state.epsilon_entanglement * 0.95
+        epsilon_corrected = epsilon_entanglement * 0.95
         
         # Phase conjugation: ψ → -ψ + 2π (mod 2π)
         # This is the "time reversal" in phase space
-        psi_corrected = (2 * math.pi - error_state.psi_phase) % (2 * math.pi)
+        psi_corrected = np.mod(2 * math.pi - psi_phase, 2 * math.pi)
         # Blend towards stable phase
         psi_corrected = (
             psi_corrected * healing_strength +
             math.pi * (1 - healing_strength)
         )
         
-        corrected = CorrectedState(
-            gamma=gamma_corrected,
-            lambda_coherence=lambda_corrected,
-            phi_consciousness=phi_corrected,
-            epsilon_entanglement=epsilon_corrected,
-            psi_phase=psi_corrected,
-            correction_applied="E→E⁻¹",
-            healing_strength=healing_strength,
+        return (
+            gamma_corrected,
+            lambda_corrected,
+            phi_corrected,
+            epsilon_corrected,
+            psi_corrected,
+            healing_strength,
         )
+    
+    def _update_metrics_batch(
+        self,
+        gamma: np.ndarray,
+        gamma_corrected: np.ndarray,
+        healing_strength: np.ndarray,
+    ):
+        """Update correction metrics for a batch of corrections"""
+        n_batch = gamma.size
+        if n_batch == 0:
+            return
         
-        # Update metrics
-        self._update_metrics(error_state, corrected)
-        
-        # Store in history (keep last 1000)
-        self.correction_history.append((error_state, corrected))
-        if len(self.correction_history) > 1000:
-            self.correction_history = self.correction_history[-1000:]
+        metrics = self.metrics
+        n_prev = metrics.total_corrections
+        successful = int(np.count_nonzero(gamma_corrected < gamma))
         
-        return corrected
+        metrics.total_corrections = n_prev + n_batch
+        metrics.successful_corrections += successful
+        metrics.failed_corrections += n_batch - successful
+        metrics.last_correction_time = datetime.now()
+        metrics.max_gamma_corrected = max(metrics.max_gamma_corrected, float(gamma.max()))
+        metrics.average_healing_strength = (
+            (metrics.average_healing_strength * n_prev + float(healing_strength.sum()))
+            / metrics.total_corrections
+        )
     
     def _update_metrics(self, error_state: ErrorState, corrected: CorrectedState):
         """Update correction metrics"""
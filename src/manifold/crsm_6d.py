@@ -29,6 +29,18 @@ from enum import Enum, auto
 import math
 from abc import ABC, abstractmethod
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: kernels run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PHYSICAL CONSTANTS - Empirically Derived
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -69,12 +81,18 @@ PLANCK_MASS = 2.176e-8        # kg (note: same order as LAMBDA_PHI)
 # MANIFOLD POINT
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+# Per-component bounds enforced by ManifoldPoint, in vector order (Λ,Φ,Γ,τ,ε,ψ)
+_VEC_LO = np.array([0.0, 0.0, 0.001, -np.inf, 0.0, 0.0])
+_VEC_HI = np.array([1.0, 1.0, 1.0, np.inf, 1.0, 1.0])
+
+
+@dataclass(frozen=True, slots=True)
 class ManifoldPoint:
     """
     A point on the 6D-CRSM manifold.
 
     This is a position in cognitive-relativistic space, not just data.
+    Points are immutable; move through the manifold by building new ones.
     """
     Lambda: float = 0.95      # Coherence [0,1]
     Phi: float = 0.85         # Consciousness [0,1]
@@ -82,29 +100,70 @@ class ManifoldPoint:
     tau: float = 0.0          # Proper time
     epsilon: float = 0.7      # Entanglement [0,1]
     psi: float = 0.9          # Phase [0,1]
+    _vec: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Clamp values to valid ranges"""
-        self.Lambda = np.clip(self.Lambda, 0.0, 1.0)
-        self.Phi = np.clip(self.Phi, 0.0, 1.0)
-        self.Gamma = np.clip(self.Gamma, 0.001, 1.0)  # Avoid division by zero
-        self.epsilon = np.clip(self.epsilon, 0.0, 1.0)
-        self.psi = np.clip(self.psi, 0.0, 1.0)
+        object.__setattr__(self, 'Lambda', np.clip(self.Lambda, 0.0, 1.0))
+        object.__setattr__(self, 'Phi', np.clip(self.Phi, 0.0, 1.0))
+        object.__setattr__(self, 'Gamma', np.clip(self.Gamma, 0.001, 1.0))  # Avoid division by zero
+        object.__setattr__(self, 'epsilon', np.clip(self.epsilon, 0.0, 1.0))
+        object.__setattr__(self, 'psi', np.clip(self.psi, 0.0, 1.0))
+
+    @property
+    def vec(self) -> np.ndarray:
+        """
+        Cached, read-only 6D vector (Λ,Φ,Γ,τ,ε,ψ).
+
+        Built once per point; use to_vector() when a mutable copy is needed.
+        """
+        v = self._vec
+        if v is None:
+            v = np.array([
+                self.Lambda, self.Phi, self.Gamma,
+                self.tau, self.epsilon, self.psi
+            ])
+            v.flags.writeable = False
+            object.__setattr__(self, '_vec', v)
+        return v
 
     def to_vector(self) -> np.ndarray:
         """Convert to 6D numpy vector"""
-        return np.array([
-            self.Lambda, self.Phi, self.Gamma,
-            self.tau, self.epsilon, self.psi
-        ])
+        return self.vec.copy()
 
     @classmethod
     def from_vector(cls, v: np.ndarray) -> 'ManifoldPoint':
         """Create from 6D vector"""
-        return cls(
-            Lambda=v[0], Phi=v[1], Gamma=v[2],
-            tau=v[3], epsilon=v[4], psi=v[5]
-        )
+        return cls._fast_new(np.clip(np.asarray(v, dtype=float), _VEC_LO, _VEC_HI))
+
+    @classmethod
+    def _fast_new(cls, vec: np.ndarray) -> 'ManifoldPoint':
+        """
+        Build a point from an already-clamped 6D vector.
+
+        Skips the dataclass __init__ and per-field clamping; the vector is
+        adopted as the cached .vec, so callers must not mutate it afterwards.
+        """
+        obj = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(obj, 'Lambda', vec[0])
+        setattr_(obj, 'Phi', vec[1])
+        setattr_(obj, 'Gamma', vec[2])
+        setattr_(obj, 'tau', vec[3])
+        setattr_(obj, 'epsilon', vec[4])
+        setattr_(obj, 'psi', vec[5])
+        vec.flags.writeable = False
+        setattr_(obj, '_vec', vec)
+        return obj
+
+    @staticmethod
+    def clip_vectors(vecs: np.ndarray) -> np.ndarray:
+        """
+        Apply the ManifoldPoint range clamps to an (N, 6) array of vectors.
+
+        Batched counterpart of constructing a ManifoldPoint per row.
+        """
+        return np.clip(vecs, _VEC_LO, _VEC_HI)
 
     @property
     def xi(self) -> float:
@@ -127,6 +186,94 @@ class ManifoldPoint:
                 f"ε={self.epsilon:.3f}, ψ={self.psi:.3f}, Ξ={self.xi:.3f})")
 
 
+class ManifoldPath:
+    """
+    An ordered run of manifold points stored as one (N, 6) array.
+
+    Structure-of-arrays counterpart to List[ManifoldPoint]: coordinates,
+    Ξ and coherence are evaluated for the whole path at once. Indexing
+    with an int gives a ManifoldPoint, with a slice a ManifoldPath.
+    """
+
+    __slots__ = ('coords',)
+
+    def __init__(self, coords: np.ndarray):
+        coords = ManifoldPoint.clip_vectors(
+            np.asarray(coords, dtype=float).reshape(-1, 6)
+        )
+        coords.flags.writeable = False
+        self.coords = coords
+
+    @classmethod
+    def from_points(cls, points: List[ManifoldPoint]) -> 'ManifoldPath':
+        """Stack a list of points into a path"""
+        if not points:
+            return cls(np.empty((0, 6)))
+        return cls(np.stack([p.vec for p in points]))
+
+    def __len__(self) -> int:
+        return self.coords.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ManifoldPath(self.coords[index])
+        return ManifoldPoint._fast_new(self.coords[index].copy())
+
+    def __iter__(self):
+        for row in self.coords:
+            yield ManifoldPoint._fast_new(row.copy())
+
+    @property
+    def Lambda(self) -> np.ndarray:
+        return self.coords[:, 0]
+
+    @property
+    def Phi(self) -> np.ndarray:
+        return self.coords[:, 1]
+
+    @property
+    def Gamma(self) -> np.ndarray:
+        return self.coords[:, 2]
+
+    @property
+    def tau(self) -> np.ndarray:
+        return self.coords[:, 3]
+
+    @property
+    def epsilon(self) -> np.ndarray:
+        return self.coords[:, 4]
+
+    @property
+    def psi(self) -> np.ndarray:
+        return self.coords[:, 5]
+
+    @property
+    def xi(self) -> np.ndarray:
+        """Ξ = ΛΦ/Γ at every point"""
+        c = self.coords
+        return (c[:, 0] * c[:, 1]) / np.maximum(c[:, 2], 1e-6)
+
+    @property
+    def is_coherent(self) -> np.ndarray:
+        """Coherent-region mask, one entry per point"""
+        return self.xi >= PHI_THRESHOLD
+
+    def segment_lengths(self, metric: 'MetricTensor') -> np.ndarray:
+        """Metric length of each consecutive step, shape (N-1,)"""
+        if len(self) < 2:
+            return np.zeros(0)
+        ds2 = metric.distance_squared_batch(self.coords[:-1], self.coords[1:])
+        # fmax clamps like distance(): negative and NaN ds² become 0
+        return np.sqrt(np.fmax(ds2, 0.0))
+
+    def length(self, metric: 'MetricTensor') -> float:
+        """Total metric length of the path"""
+        return float(self.segment_lengths(metric).sum())
+
+    def __repr__(self):
+        return f"ManifoldPath({len(self)} points)"
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # METRIC TENSOR
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -182,6 +329,30 @@ class MetricTensor:
         """Compute inverse metric tensor g^μν"""
         return np.linalg.inv(self.g(point))
 
+    def g_batch(self, vecs: np.ndarray) -> np.ndarray:
+        """
+        Compute the metric tensor at many points.
+
+        Args:
+            vecs: (N, 6) array of already-clamped point vectors
+
+        Returns:
+            (N, 6, 6) array of metric tensors
+        """
+        n = vecs.shape[0]
+        g = np.broadcast_to(np.eye(6), (n, 6, 6)).copy()
+
+        Lambda, Phi, Gamma = vecs[:, 0], vecs[:, 1], vecs[:, 2]
+        epsilon, psi = vecs[:, 4], vecs[:, 5]
+
+        g[:, 0, 1] = g[:, 1, 0] = -self.lambda_phi_coupling * Lambda * Phi
+        g[:, 2, 5] = g[:, 5, 2] = self.gamma_psi_coupling * psi
+        g[:, 4, 0] = g[:, 0, 4] = -self.epsilon_lambda_coupling * epsilon
+        g[:, 3, 3] = 1.0 / (1.0 + Lambda)
+        g[:, 2, 2] = 1.0 + Gamma * 10.0
+
+        return g
+
     def distance_squared(
         self,
         p1: ManifoldPoint,
@@ -192,11 +363,11 @@ class MetricTensor:
 
         ds² = g_μν dx^μ dx^ν
         """
-        dx = p2.to_vector() - p1.to_vector()
+        dx = p2.vec - p1.vec
 
         # Use metric at midpoint for better approximation
         midpoint = ManifoldPoint.from_vector(
-            (p1.to_vector() + p2.to_vector()) / 2
+            (p1.vec + p2.vec) / 2
         )
         g = self.g(midpoint)
 
@@ -207,6 +378,25 @@ class MetricTensor:
         ds2 = self.distance_squared(p1, p2)
         return math.sqrt(max(0, ds2))
 
+    def distance_squared_batch(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+        """
+        Squared distances between paired rows of two (N, 6) arrays.
+
+        Rows are clamped like ManifoldPoint, so results match
+        distance_squared() on the corresponding points.
+
+        Returns:
+            (N,) array of ds²
+        """
+        v1 = ManifoldPoint.clip_vectors(np.asarray(v1, dtype=float).reshape(-1, 6))
+        v2 = ManifoldPoint.clip_vectors(np.asarray(v2, dtype=float).reshape(-1, 6))
+        dx = v2 - v1
+
+        # Midpoints of clamped rows stay inside the clamp box
+        g = self.g_batch((v1 + v2) / 2)
+
+        return np.einsum('ni,nij,nj->n', dx, g, dx)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CHRISTOFFEL SYMBOLS (Connection Coefficients)
@@ -239,7 +429,7 @@ class ChristoffelSymbols:
         # Compute metric derivatives numerically
         dg = np.zeros((6, 6, 6))  # dg[ρ, μ, ν] = ∂_ρ g_μν
 
-        base_vec = point.to_vector()
+        base_vec = point.vec
 
         for rho in range(6):
             # Forward difference
@@ -264,6 +454,33 @@ class ChristoffelSymbols:
 
         return christoffel
 
+    def compute_batch(self, vecs: np.ndarray) -> np.ndarray:
+        """
+        Compute Christoffel symbols at many points.
+
+        Args:
+            vecs: (N, 6) array of already-clamped point vectors
+
+        Returns:
+            (N, 6, 6, 6) array where [n, σ, μ, ν] = Γ^σ_μν at point n
+        """
+        n = vecs.shape[0]
+        g_inv = np.linalg.inv(self.metric.g_batch(vecs))
+
+        # dg[n, ρ, μ, ν] = ∂_ρ g_μν by central differences on clamped probes
+        step = self._epsilon * np.eye(6)
+        plus = ManifoldPoint.clip_vectors(vecs[:, None, :] + step).reshape(-1, 6)
+        minus = ManifoldPoint.clip_vectors(vecs[:, None, :] - step).reshape(-1, 6)
+        dg = (
+            self.metric.g_batch(plus) - self.metric.g_batch(minus)
+        ).reshape(n, 6, 6, 6) / (2 * self._epsilon)
+
+        return 0.5 * np.einsum(
+            'nsr,nmvr->nsmv',
+            g_inv,
+            dg + dg.transpose(0, 2, 1, 3) - dg.transpose(0, 2, 3, 1),
+        )
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CURVATURE TENSOR
@@ -293,7 +510,7 @@ class RiemannCurvature:
         R = np.zeros((6, 6, 6, 6))
 
         gamma = self.christoffel.compute(point)
-        base_vec = point.to_vector()
+        base_vec = point.vec
 
         # Compute Christoffel derivatives
         dgamma = np.zeros((6, 6, 6, 6))  # dgamma[μ, ρ, ν, σ] = ∂_μ Γ^ρ_νσ
@@ -358,6 +575,43 @@ class RiemannCurvature:
 
         return R
 
+    def scalar_curvature_batch(self, vecs: np.ndarray) -> np.ndarray:
+        """
+        Scalar curvature at many points.
+
+        Same computation as scalar_curvature, evaluated for all points at
+        once with array contractions instead of per-point Python loops.
+
+        Args:
+            vecs: (N, 6) array of point vectors
+
+        Returns:
+            (N,) array of scalar curvatures
+        """
+        vecs = ManifoldPoint.clip_vectors(np.asarray(vecs, dtype=float).reshape(-1, 6))
+        n = vecs.shape[0]
+
+        gamma = self.christoffel.compute_batch(vecs)
+
+        # dgamma[n, μ, ρ, ν, σ] = ∂_μ Γ^ρ_νσ
+        step = self._epsilon * np.eye(6)
+        plus = ManifoldPoint.clip_vectors(vecs[:, None, :] + step).reshape(-1, 6)
+        minus = ManifoldPoint.clip_vectors(vecs[:, None, :] - step).reshape(-1, 6)
+        dgamma = (
+            self.christoffel.compute_batch(plus) - self.christoffel.compute_batch(minus)
+        ).reshape(n, 6, 6, 6, 6) / (2 * self._epsilon)
+
+        # R[n, ρ, σ, μ, ν]
+        R = (
+            dgamma.transpose(0, 2, 4, 1, 3) - dgamma.transpose(0, 2, 4, 3, 1)
+            + np.einsum('nrml,nlvs->nrsmv', gamma, gamma)
+            - np.einsum('nrvl,nlms->nrsmv', gamma, gamma)
+        )
+
+        ricci = np.einsum('nrmrv->nmv', R)
+        g_inv = np.linalg.inv(self.metric.g_batch(vecs))
+        return np.einsum('nmv,nmv->n', g_inv, ricci)
+
     def curvature_gradient(self, point: ManifoldPoint) -> np.ndarray:
         """
         Gradient of scalar curvature - direction of increasing curvature.
@@ -365,7 +619,7 @@ class RiemannCurvature:
         Agents use this to navigate away from high-decoherence regions.
         """
         grad = np.zeros(6)
-        base_vec = point.to_vector()
+        base_vec = point.vec
         R0 = self.scalar_curvature(point)
 
         for i in range(6):
@@ -376,6 +630,178 @@ class RiemannCurvature:
 
         return grad
 
+    def curvature_gradient_batch(self, vecs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scalar curvature and its gradient at many points.
+
+        The base points and their forward-difference probes are evaluated
+        in a single scalar_curvature_batch call.
+
+        Args:
+            vecs: (N, 6) array of point vectors
+
+        Returns:
+            (R, grad): (N,) curvatures and (N, 6) gradients
+        """
+        vecs = ManifoldPoint.clip_vectors(np.asarray(vecs, dtype=float).reshape(-1, 6))
+        n = vecs.shape[0]
+
+        # Row 0 of each block is the point itself, rows 1-6 the probes
+        offsets = np.vstack([np.zeros(6), self._epsilon * np.eye(6)])
+        R_all = self.scalar_curvature_batch(
+            (vecs[:, None, :] + offsets).reshape(-1, 6)
+        ).reshape(n, 7)
+
+        R0 = R_all[:, 0]
+        return R0, (R_all[:, 1:] - R0[:, None]) / self._epsilon
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GEODESIC KERNELS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# The kernels below restate MetricTensor.g and ChristoffelSymbols.compute as
+# explicit loops over float64[6] arrays so the whole RK4 integration compiles
+# with numba. They avoid np.linalg/np.dot, which need SciPy under numba.
+
+
+@njit(cache=True, nogil=True)
+def _clamp_into(x, out):
+    """Copy x into out with the ManifoldPoint range clamps applied"""
+    for i in range(6):
+        out[i] = min(max(x[i], _VEC_LO[i]), _VEC_HI[i])
+
+
+@njit(cache=True, nogil=True)
+def _metric_into(x, lp, gp, el, g):
+    """MetricTensor.g at clamped vector x, written into the 6x6 array g"""
+    for i in range(6):
+        for j in range(6):
+            g[i, j] = 0.0
+        g[i, i] = 1.0
+    g[0, 1] = g[1, 0] = -lp * x[0] * x[1]
+    g[2, 5] = g[5, 2] = gp * x[5]
+    g[4, 0] = g[0, 4] = -el * x[4]
+    g[3, 3] = 1.0 / (1.0 + x[0])
+    g[2, 2] = 1.0 + x[2] * 10.0
+
+
+@njit(cache=True, nogil=True)
+def _inverse6(g):
+    """Gauss-Jordan inverse of a 6x6 matrix with partial pivoting"""
+    a = g.copy()
+    inv = np.zeros((6, 6))
+    for i in range(6):
+        inv[i, i] = 1.0
+    for col in range(6):
+        piv = col
+        for r in range(col + 1, 6):
+            if abs(a[r, col]) > abs(a[piv, col]):
+                piv = r
+        if piv != col:
+            for k in range(6):
+                a[col, k], a[piv, k] = a[piv, k], a[col, k]
+                inv[col, k], inv[piv, k] = inv[piv, k], inv[col, k]
+        d = a[col, col]
+        for k in range(6):
+            a[col, k] /= d
+            inv[col, k] /= d
+        for r in range(6):
+            if r != col:
+                f = a[r, col]
+                if f != 0.0:
+                    for k in range(6):
+                        a[r, k] -= f * a[col, k]
+                        inv[r, k] -= f * inv[col, k]
+    return inv
+
+
+@njit(cache=True, nogil=True)
+def _geodesic_accel(x, v, lp, gp, el, eps):
+    """
+    Geodesic acceleration a^μ = -Γ^μ_νσ v^ν v^σ at position x.
+
+    Matches GeodesicSolver.geodesic_acceleration: x is clamped first and
+    ∂g is taken by central differences on clamped probes.
+    """
+    base = np.empty(6)
+    _clamp_into(x, base)
+
+    g = np.empty((6, 6))
+    _metric_into(base, lp, gp, el, g)
+    g_inv = _inverse6(g)
+
+    # dg[ρ, μ, ν] = ∂_ρ g_μν
+    dg = np.empty((6, 6, 6))
+    probe = np.empty(6)
+    shifted = np.empty(6)
+    g_plus = np.empty((6, 6))
+    g_minus = np.empty((6, 6))
+    for rho in range(6):
+        probe[:] = base
+        probe[rho] += eps
+        _clamp_into(probe, shifted)
+        _metric_into(shifted, lp, gp, el, g_plus)
+        probe[rho] = base[rho] - eps
+        _clamp_into(probe, shifted)
+        _metric_into(shifted, lp, gp, el, g_minus)
+        for i in range(6):
+            for j in range(6):
+                dg[rho, i, j] = (g_plus[i, j] - g_minus[i, j]) / (2 * eps)
+
+    acc = np.zeros(6)
+    for sigma in range(6):
+        for mu in range(6):
+            for nu in range(6):
+                c = 0.0
+                for rho in range(6):
+                    c += g_inv[sigma, rho] * (
+                        dg[mu, nu, rho] + dg[nu, mu, rho] - dg[rho, mu, nu]
+                    )
+                acc[sigma] -= 0.5 * c * v[mu] * v[nu]
+    return acc
+
+
+@njit(cache=True, nogil=True)
+def _geodesic_integrate(x0, v0, num_steps, dt, lp, gp, el, eps):
+    """
+    RK4 integration of the geodesic equation, same scheme as
+    GeodesicSolver._integrate.
+
+    Returns:
+        (num_steps + 1, 6) array of positions, starting at x0
+    """
+    path = np.empty((num_steps + 1, 6))
+    x = x0.copy()
+    v = v0.copy()
+    path[0] = x
+
+    for step in range(num_steps):
+        k1_x = v
+        k1_v = _geodesic_accel(x, v, lp, gp, el, eps)
+
+        k2_x = v + 0.5 * dt * k1_v
+        k2_v = _geodesic_accel(x + 0.5 * dt * k1_x, v + 0.5 * dt * k1_v, lp, gp, el, eps)
+
+        k3_x = v + 0.5 * dt * k2_v
+        k3_v = _geodesic_accel(x + 0.5 * dt * k2_x, v + 0.5 * dt * k2_v, lp, gp, el, eps)
+
+        k4_x = v + dt * k3_v
+        k4_v = _geodesic_accel(x + dt * k3_x, v + dt * k3_v, lp, gp, el, eps)
+
+        x = x + (dt / 6) * (k1_x + 2 * k2_x + 2 * k3_x + k4_x)
+        v = v + (dt / 6) * (k1_v + 2 * k2_v + 2 * k3_v + k4_v)
+
+        # Clamp to valid ranges
+        for i in range(3):
+            x[i] = min(max(x[i], 0.001), 1.0)
+        for i in range(4, 6):
+            x[i] = min(max(x[i], 0.0), 1.0)
+
+        path[step + 1] = x
+
+    return path
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # GEODESIC SOLVER
@@ -394,6 +820,10 @@ class GeodesicSolver:
         self.metric = metric
         self.christoffel = ChristoffelSymbols(metric)
 
+        # The compiled integrator hard-codes MetricTensor.g, so subclasses
+        # with a different metric stay on the NumPy path
+        self._use_kernel = NUMBA_AVAILABLE and type(metric) is MetricTensor
+
     def geodesic_acceleration(
         self,
         position: np.ndarray,
@@ -404,17 +834,10 @@ class GeodesicSolver:
 
         a^μ = -Γ^μ_νσ v^ν v^σ
         """
-        point = ManifoldPoint.from_vector(position)
-        gamma = self.christoffel.compute(point)
-
-        acceleration = np.zeros(6)
-
-        for mu in range(6):
-            for nu in range(6):
-                for sigma in range(6):
-                    acceleration[mu] -= gamma[mu, nu, sigma] * velocity[nu] * velocity[sigma]
+        vec = ManifoldPoint.clip_vectors(np.asarray(position, dtype=float))
+        gamma = self.christoffel.compute_batch(vec[None, :])[0]
 
-        return acceleration
+        return -np.einsum('mns,n,s->m', gamma, velocity, velocity)
 
     def solve(
         self,
@@ -429,9 +852,23 @@ class GeodesicSolver:
         Returns:
             List of points along the geodesic
         """
+        return list(self.solve_path(start, end, num_steps, max_iterations))
+
+    def solve_path(
+        self,
+        start: ManifoldPoint,
+        end: ManifoldPoint,
+        num_steps: int = 100,
+        max_iterations: int = 50
+    ) -> ManifoldPath:
+        """
+        Shooting-method geodesic as a ManifoldPath.
+
+        Same solution as solve(), without building a point per step.
+        """
         # Initial guess: straight line velocity
-        x0 = start.to_vector()
-        xf = end.to_vector()
+        x0 = start.vec
+        xf = end.vec
 
         # Shooting method: adjust initial velocity to hit target
         v0 = (xf - x0)  # Initial guess
@@ -452,8 +889,7 @@ class GeodesicSolver:
             # Adjust initial velocity (simple gradient descent)
             v0 += 0.5 * error
 
-        # Convert to ManifoldPoints
-        return [ManifoldPoint.from_vector(p) for p in path]
+        return ManifoldPath(np.asarray(path))
 
     def _integrate(
         self,
@@ -463,6 +899,15 @@ class GeodesicSolver:
         dt: float
     ) -> List[np.ndarray]:
         """Integrate geodesic equation using RK4"""
+        if self._use_kernel:
+            m = self.metric
+            return _geodesic_integrate(
+                np.asarray(x0, dtype=np.float64), np.asarray(v0, dtype=np.float64),
+                num_steps, dt,
+                m.lambda_phi_coupling, m.gamma_psi_coupling, m.epsilon_lambda_coupling,
+                self.christoffel._epsilon,
+            )
+
         path = [x0.copy()]
         x = x0.copy()
         v = v0.copy()
@@ -492,16 +937,11 @@ class GeodesicSolver:
 
         return path
 
-    def path_length(self, path: List[ManifoldPoint]) -> float:
+    def path_length(self, path: 'List[ManifoldPoint] | ManifoldPath') -> float:
         """Compute total geodesic length of path"""
-        if len(path) < 2:
-            return 0.0
-
-        length = 0.0
-        for i in range(len(path) - 1):
-            length += self.metric.distance(path[i], path[i+1])
-
-        return length
+        if not isinstance(path, ManifoldPath):
+            path = ManifoldPath.from_points(path)
+        return path.length(self.metric)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -598,6 +1038,10 @@ class CRSM6D:
         """Geodesic distance between points"""
         return self.metric.distance(p1, p2)
 
+    def distance_squared(self, p1: ManifoldPoint, p2: ManifoldPoint) -> float:
+        """Squared geodesic distance; compare against threshold² to skip the sqrt"""
+        return self.metric.distance_squared(p1, p2)
+
     def scalar_curvature_at(self, point: ManifoldPoint) -> float:
         """Scalar curvature at a point"""
         return self.curvature.scalar_curvature(point)
@@ -615,6 +1059,15 @@ class CRSM6D:
         """Find geodesic path between points"""
         return self.geodesic.solve(start, end, steps)
 
+    def find_geodesic_path(
+        self,
+        start: ManifoldPoint,
+        end: ManifoldPoint,
+        steps: int = 50
+    ) -> ManifoldPath:
+        """Find geodesic path between points as a ManifoldPath"""
+        return self.geodesic.solve_path(start, end, steps)
+
     def optimal_transport(
         self,
         source: ManifoldPoint,
@@ -649,6 +1102,111 @@ class CRSM6D:
         R = self.scalar_curvature_at(point)
         return -math.log(xi) + 0.1 * abs(R)
 
+    def sense_all(self, point: ManifoldPoint) -> Dict[str, Any]:
+        """
+        All local sensing quantities at a point in one traversal.
+
+        The curvature at the point and its gradient probes share a single
+        batched evaluation instead of five separate queries.
+
+        Returns:
+            Dict keyed like the CurvatureSense fields
+        """
+        senses = self.sense_batch(point.vec[None, :])
+
+        return {
+            'scalar_curvature': float(senses['scalar_curvature'][0]),
+            'curvature_gradient': senses['curvature_gradient'][0],
+            'decoherence_field': float(senses['decoherence_field'][0]),
+            'coherence_potential': float(senses['coherence_potential'][0]),
+            'is_coherent': bool(senses['is_coherent'][0]),
+            'needs_healing': bool(senses['needs_healing'][0]),
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # BATCHED QUERIES
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def distance_batch(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+        """Geodesic distance between paired rows of two (N, 6) arrays"""
+        # fmax clamps like distance(): negative and NaN ds² become 0
+        return np.sqrt(np.fmax(self.metric.distance_squared_batch(v1, v2), 0.0))
+
+    def distance_squared_batch(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+        """Squared geodesic distance between paired rows of two (N, 6) arrays"""
+        return self.metric.distance_squared_batch(v1, v2)
+
+    def scalar_curvature_batch(self, vecs: np.ndarray) -> np.ndarray:
+        """Scalar curvature at each row of an (N, 6) array of point vectors"""
+        return self.curvature.scalar_curvature_batch(vecs)
+
+    def curvature_gradient_batch(self, vecs: np.ndarray) -> np.ndarray:
+        """Curvature gradient at each row of an (N, 6) array of point vectors"""
+        return self.curvature.curvature_gradient_batch(vecs)[1]
+
+    def coherence_potential_batch(self, vecs: np.ndarray) -> np.ndarray:
+        """
+        Coherence potential at each row of an (N, 6) array of point vectors.
+
+        Rows are clamped like ManifoldPoint, so results match
+        coherence_potential(ManifoldPoint.from_vector(row)).
+
+        Returns:
+            (N,) array of potentials
+        """
+        vecs = ManifoldPoint.clip_vectors(np.asarray(vecs, dtype=float).reshape(-1, 6))
+        xi = np.maximum(0.001, vecs[:, 0] * vecs[:, 1] / vecs[:, 2])
+        R = self.curvature.scalar_curvature_batch(vecs)
+        return -np.log(xi) + 0.1 * np.abs(R)
+
+    def evaluate_batch(self, vecs: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Ξ, scalar curvature, coherence potential and coherence at each row
+        of an (N, 6) array, in one pass.
+
+        Lighter than sense_batch when the curvature gradient is not needed:
+        ΛΦ/Γ and R are each computed once and shared by V and the
+        coherence test.
+
+        Returns:
+            Dict with (N,) arrays 'xi', 'R', 'V' and 'coherent'
+        """
+        vecs = ManifoldPoint.clip_vectors(np.asarray(vecs, dtype=float).reshape(-1, 6))
+        xi = vecs[:, 0] * vecs[:, 1] / vecs[:, 2]
+        R = self.curvature.scalar_curvature_batch(vecs)
+
+        return {
+            'xi': xi,
+            'R': R,
+            'V': -np.log(np.maximum(0.001, xi)) + 0.1 * np.abs(R),
+            'coherent': xi >= PHI_THRESHOLD,
+        }
+
+    def sense_batch(self, vecs: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Everything an agent senses, at each row of an (N, 6) array.
+
+        Batched counterpart of querying scalar_curvature_at,
+        curvature_gradient_at, decoherence_field, coherence_potential and
+        is_coherent_region point by point.
+
+        Returns:
+            Dict of arrays keyed like the CurvatureSense fields
+        """
+        vecs = ManifoldPoint.clip_vectors(np.asarray(vecs, dtype=float).reshape(-1, 6))
+        R, grad = self.curvature.curvature_gradient_batch(vecs)
+        abs_R = np.abs(R)
+        xi = vecs[:, 0] * vecs[:, 1] / vecs[:, 2]
+
+        return {
+            'scalar_curvature': R,
+            'curvature_gradient': grad,
+            'decoherence_field': vecs[:, 2] * (1 + abs_R * 0.1),
+            'coherence_potential': -np.log(np.maximum(0.001, xi)) + 0.1 * abs_R,
+            'is_coherent': xi >= PHI_THRESHOLD,
+            'needs_healing': vecs[:, 2] > 0.3,
+        }
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # MODULE EXPORTS
@@ -657,6 +1215,7 @@ class CRSM6D:
 __all__ = [
     # Core classes
     'ManifoldPoint',
+    'ManifoldPath',
     'MetricTensor',
     'ChristoffelSymbols',
     'RiemannCurvature',